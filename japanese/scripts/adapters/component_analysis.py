@@ -8,16 +8,27 @@ and KanjiVG (fallback). Used by:
 - regenerate_grapheme_dependencies.py
 
 This module provides functions to:
-1. Load CHISE IDS data
-2. Load KanjiVG index
+1. Load CHISE IDS data (pre-decomposed into component sets)
+2. Load KanjiVG index and pre-parse its component sets
 3. Extract components from a character using CHISE or KanjiVG
 """
 
+import functools
 import json
+import pickle
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Optional
+
+# Optional fast JSON parser (falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # ---------------------------------------------------------------------------
 # Path Configuration (from shared module)
@@ -39,8 +50,20 @@ from kanjivg import StrokeGr
 # ---------------------------------------------------------------------------
 
 # Unicode Ideographic Description Characters (U+2FF0-U+2FFF)
-# These operators describe how components are spatially arranged
-IDS_OPERATORS = set(chr(c) for c in range(0x2FF0, 0x3000))
+# These operators describe how components are spatially arranged.
+# The block is contiguous, so it is also usable as a codepoint range.
+_IDS_OP_START, _IDS_OP_END = 0x2FF0, 0x3000
+IDS_OPERATORS = set(chr(c) for c in range(_IDS_OP_START, _IDS_OP_END))
+
+# Entity references like &CDP-XXXX; or &M-XXXXX; (glyphs with no Unicode codepoint)
+_ENTITY_RE = re.compile(r'&[^;]+;')
+
+# str.translate table deleting everything that is never a component:
+# low codepoints (ASCII, punctuation, whitespace), IDS operators, and the
+# ideographic space (U+3000, the only whitespace at or above U+2E80)
+_STRIP_TABLE: dict[int, None] = dict.fromkeys(range(0x2E80))
+_STRIP_TABLE.update(dict.fromkeys(range(_IDS_OP_START, _IDS_OP_END)))
+_STRIP_TABLE[0x3000] = None
 
 
 # ---------------------------------------------------------------------------
@@ -58,20 +81,26 @@ def load_chise_ids(path: Path = CHISE_IDS_PATH) -> dict[str, str]:
     if not path.exists():
         return char_to_ids
 
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith(";"):
-                continue
-
-            parts = line.split("\t")
-            if len(parts) >= 3:
-                char = parts[1]
-                ids = parts[2]
-                # Remove @apparent suffix if present
-                if "@apparent=" in ids:
-                    ids = ids.split("@apparent=")[0].strip()
-                char_to_ids[char] = ids
+    intern = sys.intern
+
+    # Decode the whole file in one go rather than line by line through io
+    text = path.read_bytes().decode("utf-8")
+
+    for line in text.splitlines():
+        if not line or line[0] == ";":
+            continue
+
+        # Only the first three fields are used; blank lines fall out here
+        parts = line.rstrip().split("\t", 3)
+        if len(parts) < 3:
+            continue
+
+        # Remove @apparent suffix if present
+        ids, sep, _ = parts[2].partition("@apparent=")
+        if sep:
+            ids = ids.strip()
+        # Interned so the same char shares one object across all tables
+        char_to_ids[intern(parts[1])] = ids
 
     return char_to_ids
 
@@ -88,67 +117,72 @@ def extract_ids_components(ids: str) -> set[str]:
     Returns:
         Set of unique component characters.
     """
-    components = set()
+    # Remove entity references, then drop operators/whitespace/non-CJK in one pass
+    return {sys.intern(c) for c in _ENTITY_RE.sub('', ids).translate(_STRIP_TABLE)}
 
-    # Remove entity references like &CDP-XXXX; or &M-XXXXX;
-    ids_clean = re.sub(r'&[^;]+;', '', ids)
 
-    for char in ids_clean:
-        # Skip IDS operators
-        if char in IDS_OPERATORS:
-            continue
-        # Skip whitespace and low codepoints (punctuation, ASCII, etc.)
-        if char.isspace() or ord(char) < 0x2E80:
-            continue
-        components.add(char)
+# Shared result for characters without components (never mutate)
+_EMPTY: frozenset[str] = frozenset()
 
-    return components
 
+# Bump when the CHISE parsing/extraction logic changes to invalidate caches
+_CHISE_CACHE_VERSION = 1
 
-# Cache for CHISE IDS components
-_chise_cache: dict[str, set[str]] = {}
 
-
-def get_chise_components(char: str, chise_ids: dict[str, str]) -> set[str]:
+def load_chise_components(path: Path = CHISE_IDS_PATH) -> dict[str, frozenset[str]]:
     """
-    Get components of a character from CHISE IDS data.
+    Load CHISE IDS file and return mapping of char -> component set.
 
-    Args:
-        char: The character to decompose
-        chise_ids: Dict mapping char -> IDS string
+    Components are extracted once at load time, so lookups never re-parse
+    IDS strings. Atomic characters (e.g., 一 has IDS "一") map to an empty
+    set, so membership still means "present in CHISE".
 
-    Returns:
-        Set of component characters (may be empty if char == its IDS)
+    The table is cached next to the source as <name>.cache.pkl and reused
+    while the cache is newer than the IDS file.
     """
-    global _chise_cache
+    if not path.exists():
+        return {}
 
-    if char in _chise_cache:
-        return _chise_cache[char]
+    cache_path = path.with_suffix(".cache.pkl")
 
-    if char not in chise_ids:
-        _chise_cache[char] = set()
-        return set()
+    if cache_path.exists() and cache_path.stat().st_mtime >= path.stat().st_mtime:
+        try:
+            version, char_to_components = pickle.loads(cache_path.read_bytes())
+            if version == _CHISE_CACHE_VERSION:
+                return char_to_components
+        except Exception:
+            pass  # Unreadable or incompatible cache, re-parse
 
-    ids = chise_ids[char]
-    components = extract_ids_components(ids)
+    char_to_components: dict[str, frozenset[str]] = {}
 
-    # If the only "component" is the character itself, it's atomic
-    # (e.g., 一 has IDS "一" - no real decomposition)
-    if components == {char}:
-        _chise_cache[char] = set()
-        return set()
+    for char, ids in load_chise_ids(path).items():
+        components = extract_ids_components(ids)
+        # A character shouldn't be its own component
+        components.discard(char)
+        char_to_components[char] = frozenset(components) if components else _EMPTY
 
-    # Remove the character itself from components (shouldn't be its own component)
-    components.discard(char)
+    try:
+        cache_path.write_bytes(
+            pickle.dumps((_CHISE_CACHE_VERSION, char_to_components), protocol=5)
+        )
+    except OSError:
+        pass  # Caching is best-effort
 
-    _chise_cache[char] = components
-    return components
+    return char_to_components
 
 
-def clear_chise_cache():
-    """Clear the CHISE components cache."""
-    global _chise_cache
-    _chise_cache = {}
+def get_chise_components(char: str, chise_components: dict[str, frozenset[str]]) -> frozenset[str]:
+    """
+    Get components of a character from CHISE IDS data.
+
+    Args:
+        char: The character to decompose
+        chise_components: Dict mapping char -> components (from load_chise_components)
+
+    Returns:
+        Set of component characters (may be empty if char == its IDS)
+    """
+    return chise_components.get(char, _EMPTY)
 
 
 # ---------------------------------------------------------------------------
@@ -158,162 +192,124 @@ def clear_chise_cache():
 def load_kanjivg_index(path: Path = KVG_INDEX_PATH) -> set[str]:
     """
     Load kvg-index.json and return set of all characters with SVG files.
+
+    Only the keys are needed; orjson is used when installed since it
+    parses the (discarded) stroke-file lists much faster than stdlib json.
     """
-    with open(path, "r", encoding="utf-8") as f:
-        index = json.load(f)
-    return set(index.keys())
+    data = Path(path).read_bytes()
+    index = orjson.loads(data) if orjson is not None else json.loads(data)
+    return {sys.intern(char) for char in index}
 
 
 # ---------------------------------------------------------------------------
 # KanjiVG Component Extraction
 # ---------------------------------------------------------------------------
 
-# Cache for parsed KanjiVG files
-_kanjivg_cache: dict[str, set[str]] = {}
-
-
-def get_kanjivg_components(char: str, kanjivg_chars: set[str]) -> set[str]:
+def _read_kanjivg_components(char: str, kvg_dir: str) -> frozenset[str]:
     """
-    Get direct child components of a kanji from KanjiVG.
-
-    Args:
-        char: The kanji character
-        kanjivg_chars: Set of chars in KanjiVG (for quick existence check)
+    Parse a character's KanjiVG SVG and return its direct child components.
 
-    Returns:
-        Set of unique direct child component characters (may be empty)
+    Returns an empty set if the file is missing or cannot be parsed.
     """
-    global _kanjivg_cache
-
-    if char in _kanjivg_cache:
-        return _kanjivg_cache[char]
-
-    if char not in kanjivg_chars:
-        _kanjivg_cache[char] = set()
-        return set()
-
     try:
         code = f"{ord(char):05x}"
-        sfi = SvgFileInfo(f"{code}.svg", str(KVG_KANJI_DIR))
+        sfi = SvgFileInfo(f"{code}.svg", kvg_dir)
         if not sfi.OK:
-            _kanjivg_cache[char] = set()
-            return set()
+            return _EMPTY
 
         kanji = sfi.read()
         if kanji and kanji.strokes:
             # Get direct children using simplified=True for canonical forms
             # Return as SET to deduplicate (e.g., 林 has 木 twice, but count once)
-            components = set(kanji.strokes.components(simplified=True, recursive=False))
-            _kanjivg_cache[char] = components
-            return components
+            components = kanji.strokes.components(simplified=True, recursive=False)
+            if components:
+                return frozenset(components)
     except Exception:
         # Silently handle parsing errors
         pass
 
-    _kanjivg_cache[char] = set()
-    return set()
+    return _EMPTY
 
 
-def clear_kanjivg_cache():
-    """Clear the KanjiVG components cache."""
-    global _kanjivg_cache
-    _kanjivg_cache = {}
+# Bump when the KanjiVG component extraction changes to invalidate caches
+_KANJIVG_CACHE_VERSION = 1
 
 
-# ---------------------------------------------------------------------------
-# Unified Component Extraction (CHISE primary, KanjiVG fallback)
-# ---------------------------------------------------------------------------
-
-def get_library_status(
-    char: str,
-    chise_ids: dict[str, str],
-    kanjivg_chars: set[str],
-    normalizer: Callable[[str], str],
-) -> tuple[str, str]:
+def _kanjivg_cache_key(kvg_dir: Path) -> tuple[int, int, int, int]:
     """
-    Determine the status of a character in both CHISE and KanjiVG.
+    Fingerprint the KanjiVG SVG directory for cache validation.
 
-    Returns:
-        Tuple of (chise_status, kanjivg_status) where each is "decomposed", "atomic", or "none"
+    The directory mtime catches added, removed and renamed files; the newest
+    file mtime catches SVGs rewritten in place.
     """
-    normalized = normalizer(char)
-
-    # CHISE status
-    chise_status = "none"
-    if char in chise_ids or normalized in chise_ids:
-        # Character exists in CHISE - check if it has components
-        chise_orig = get_chise_components(char, chise_ids)
-        chise_norm = get_chise_components(normalized, chise_ids) if char != normalized else set()
-        if chise_orig or chise_norm:
-            chise_status = "decomposed"
-        else:
-            chise_status = "atomic"
-
-    # KanjiVG status
-    kanjivg_status = "none"
-    if char in kanjivg_chars or normalized in kanjivg_chars:
-        # Character exists in KanjiVG - check if it has components
-        kvg_orig = get_kanjivg_components(char, kanjivg_chars)
-        kvg_norm = get_kanjivg_components(normalized, kanjivg_chars) if char != normalized else set()
-        if kvg_orig or kvg_norm:
-            kanjivg_status = "decomposed"
-        else:
-            kanjivg_status = "atomic"
-
-    return chise_status, kanjivg_status
+    mtimes = [p.stat().st_mtime_ns for p in kvg_dir.glob("*.svg")]
+    return (_KANJIVG_CACHE_VERSION, kvg_dir.stat().st_mtime_ns, len(mtimes), max(mtimes, default=0))
 
 
-def get_components(
-    char: str,
-    chise_ids: dict[str, str],
+def load_kanjivg_components(
     kanjivg_chars: set[str],
-    normalizer: Callable[[str], str],
-) -> tuple[set[str], str]:
+    kvg_dir: Path = KVG_KANJI_DIR,
+    max_workers: Optional[int] = None,
+) -> dict[str, frozenset[str]]:
     """
-    Get components for a character, trying CHISE first, then KanjiVG.
+    Parse every KanjiVG SVG once and return mapping of char -> components.
+
+    Files are read and parsed on a thread pool so per-file open/stat
+    latency overlaps instead of being paid serially. Every char in the
+    index gets an entry (empty if atomic or unparseable), so membership
+    still means "present in KanjiVG".
+
+    The table is cached beside the SVG directory as <dir>.components.cache.pkl
+    and reused while no SVG has changed and the requested chars are the same,
+    so later runs stat the files instead of parsing them.
 
     Args:
-        char: Original character
-        chise_ids: CHISE IDS data
-        kanjivg_chars: Set of chars with KanjiVG data
-        normalizer: Normalization function
+        kanjivg_chars: Set of chars in KanjiVG (from load_kanjivg_index)
+        kvg_dir: Directory containing the KanjiVG kanji SVG files
+        max_workers: Thread pool size (default: ThreadPoolExecutor default)
 
     Returns:
-        Tuple of (components_set, source) where source is:
-        "chise", "kanjivg", "chise-atomic", "kanjivg-atomic", or "none"
+        Dict mapping char -> direct child components
     """
-    normalized = normalizer(char)
+    kvg_dir = Path(kvg_dir)
+    cache_path = kvg_dir.with_name(f"{kvg_dir.name}.components.cache.pkl")
+    key = _kanjivg_cache_key(kvg_dir) if kvg_dir.is_dir() else None
 
-    # Try CHISE first (for both original and normalized)
-    chise_orig = get_chise_components(char, chise_ids)
-    chise_norm = get_chise_components(normalized, chise_ids) if char != normalized else set()
+    if key is not None and cache_path.exists():
+        try:
+            cached_key, char_to_components = pickle.loads(cache_path.read_bytes())
+            if cached_key == key and char_to_components.keys() == kanjivg_chars:
+                return char_to_components
+        except Exception:
+            pass  # Unreadable or incompatible cache, re-parse
 
-    # Use whichever CHISE result is larger
-    chise_components = chise_orig if len(chise_orig) >= len(chise_norm) else chise_norm
+    chars = list(kanjivg_chars)
 
-    if chise_components:
-        return chise_components, "chise"
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(_read_kanjivg_components, chars, repeat(str(kvg_dir)))
+        char_to_components = dict(zip(chars, results))
 
-    # Fall back to KanjiVG
-    kvg_orig = get_kanjivg_components(char, kanjivg_chars)
-    kvg_norm = get_kanjivg_components(normalized, kanjivg_chars) if char != normalized else set()
+    if key is not None:
+        try:
+            cache_path.write_bytes(pickle.dumps((key, char_to_components), protocol=5))
+        except OSError:
+            pass  # Caching is best-effort
 
-    # Use whichever KanjiVG result is larger
-    kvg_components = kvg_orig if len(kvg_orig) >= len(kvg_norm) else kvg_norm
+    return char_to_components
 
-    if kvg_components:
-        return kvg_components, "kanjivg"
 
-    # No components found - determine if atomic or truly missing
-    # Check if in CHISE (would be atomic since no components)
-    if char in chise_ids or normalized in chise_ids:
-        return set(), "chise-atomic"
+def get_kanjivg_components(char: str, kanjivg_components: dict[str, frozenset[str]]) -> frozenset[str]:
+    """
+    Get direct child components of a kanji from KanjiVG.
 
-    # Check if in KanjiVG (would be atomic since no components)
-    if char in kanjivg_chars or normalized in kanjivg_chars:
-        return set(), "kanjivg-atomic"
+    Args:
+        char: The kanji character
+        kanjivg_components: Dict mapping char -> components (from load_kanjivg_components)
 
-    return set(), "none"
+    Returns:
+        Set of unique direct child component characters (may be empty)
+    """
+    return kanjivg_components.get(char, _EMPTY)
 
 
 # ---------------------------------------------------------------------------
@@ -325,14 +321,164 @@ def identity_normalizer(char: str) -> str:
     return char
 
 
+# ---------------------------------------------------------------------------
+# Unified Component Extraction (CHISE primary, KanjiVG fallback)
+# ---------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=None)
+def _cached_normalize(normalizer: Callable[[str], str], char: str) -> str:
+    """
+    Memoized normalizer(char).
+
+    Normalizers are pure functions of a single character, so each unique
+    (normalizer, char) pair only needs to be computed once per run.
+    """
+    return normalizer(char)
+
+
+def _normalize(char: str, normalizer: Callable[[str], str]) -> str:
+    """Normalize char, skipping the call (and cache) for identity_normalizer."""
+    if normalizer is identity_normalizer:
+        return char
+    return _cached_normalize(normalizer, char)
+
+
+@dataclass(slots=True)
+class ResolveResult:
+    """Components and library status of a character in CHISE and KanjiVG."""
+    normalized: str                     # Normalized form of the character
+    chise_orig: frozenset[str]          # CHISE components of the original
+    chise_norm: frozenset[str]          # CHISE components of the normalized form
+    kvg_orig: frozenset[str]            # KanjiVG components of the original
+    kvg_norm: frozenset[str]            # KanjiVG components of the normalized form
+    chise_status: str                   # "decomposed", "atomic", or "none"
+    kanjivg_status: str                 # "decomposed", "atomic", or "none"
+    primary_components: frozenset[str]  # Components from primary_source
+    primary_source: str                 # "chise", "kanjivg", "chise-atomic", "kanjivg-atomic", or "none"
+
+
+def resolve(
+    char: str,
+    chise_components: dict[str, frozenset[str]],
+    kanjivg_components: dict[str, frozenset[str]],
+    normalizer: Callable[[str], str],
+) -> ResolveResult:
+    """
+    Look up a character (original and normalized) in CHISE and KanjiVG once.
+
+    get_library_status, get_components and get_all_components_expanded are
+    views on this result; call resolve directly when more than one is needed.
+
+    Args:
+        char: Original character
+        chise_components: CHISE component data
+        kanjivg_components: KanjiVG component data
+        normalizer: Normalization function (must be pure; results are memoized)
+
+    Returns:
+        ResolveResult with all four component sets and derived statuses
+    """
+    normalized = _normalize(char, normalizer)
+    has_normalized = normalized != char
+
+    chise_orig = get_chise_components(char, chise_components)
+    chise_norm = get_chise_components(normalized, chise_components) if has_normalized else _EMPTY
+    kvg_orig = get_kanjivg_components(char, kanjivg_components)
+    kvg_norm = get_kanjivg_components(normalized, kanjivg_components) if has_normalized else _EMPTY
+
+    # Library status: present with components, present without, or missing.
+    # Both tables map every known char (atomic ones to an empty set), so the
+    # presence probes are only needed when no components were found.
+    if chise_orig or chise_norm:
+        chise_status = "decomposed"
+    elif char in chise_components or (has_normalized and normalized in chise_components):
+        chise_status = "atomic"
+    else:
+        chise_status = "none"
+
+    if kvg_orig or kvg_norm:
+        kanjivg_status = "decomposed"
+    elif char in kanjivg_components or (has_normalized and normalized in kanjivg_components):
+        kanjivg_status = "atomic"
+    else:
+        kanjivg_status = "none"
+
+    # Primary source: CHISE first, then KanjiVG, using whichever of
+    # original/normalized gives the larger result
+    chise_best = chise_orig if len(chise_orig) >= len(chise_norm) else chise_norm
+    kvg_best = kvg_orig if len(kvg_orig) >= len(kvg_norm) else kvg_norm
+
+    if chise_best:
+        primary_components, primary_source = chise_best, "chise"
+    elif kvg_best:
+        primary_components, primary_source = kvg_best, "kanjivg"
+    elif chise_status == "atomic":
+        primary_components, primary_source = _EMPTY, "chise-atomic"
+    elif kanjivg_status == "atomic":
+        primary_components, primary_source = _EMPTY, "kanjivg-atomic"
+    else:
+        primary_components, primary_source = _EMPTY, "none"
+
+    return ResolveResult(
+        normalized=normalized,
+        chise_orig=chise_orig,
+        chise_norm=chise_norm,
+        kvg_orig=kvg_orig,
+        kvg_norm=kvg_norm,
+        chise_status=chise_status,
+        kanjivg_status=kanjivg_status,
+        primary_components=primary_components,
+        primary_source=primary_source,
+    )
+
+
+def get_library_status(
+    char: str,
+    chise_components: dict[str, frozenset[str]],
+    kanjivg_components: dict[str, frozenset[str]],
+    normalizer: Callable[[str], str],
+) -> tuple[str, str]:
+    """
+    Determine the status of a character in both CHISE and KanjiVG.
+
+    Returns:
+        Tuple of (chise_status, kanjivg_status) where each is "decomposed", "atomic", or "none"
+    """
+    result = resolve(char, chise_components, kanjivg_components, normalizer)
+    return result.chise_status, result.kanjivg_status
+
+
+def get_components(
+    char: str,
+    chise_components: dict[str, frozenset[str]],
+    kanjivg_components: dict[str, frozenset[str]],
+    normalizer: Callable[[str], str],
+) -> tuple[frozenset[str], str]:
+    """
+    Get components for a character, trying CHISE first, then KanjiVG.
+
+    Args:
+        char: Original character
+        chise_components: CHISE component data
+        kanjivg_components: KanjiVG component data
+        normalizer: Normalization function (must be pure; results are memoized)
+
+    Returns:
+        Tuple of (components_set, source) where source is:
+        "chise", "kanjivg", "chise-atomic", "kanjivg-atomic", or "none"
+    """
+    result = resolve(char, chise_components, kanjivg_components, normalizer)
+    return result.primary_components, result.primary_source
+
+
 # ---------------------------------------------------------------------------
 # Expanded Component Extraction (Union of All Sources)
 # ---------------------------------------------------------------------------
 
 def get_all_components_expanded(
     char: str,
-    chise_ids: dict[str, str],
-    kanjivg_chars: set[str],
+    chise_components: dict[str, frozenset[str]],
+    kanjivg_components: dict[str, frozenset[str]],
     normalizer: Callable[[str], str],
 ) -> set[str]:
     """
@@ -346,32 +492,48 @@ def get_all_components_expanded(
 
     Args:
         char: Original character
-        chise_ids: CHISE IDS data
-        kanjivg_chars: Set of chars with KanjiVG data
-        normalizer: Normalization function
+        chise_components: CHISE component data
+        kanjivg_components: KanjiVG component data
+        normalizer: Normalization function (must be pure; results are memoized)
 
     Returns:
-        Set of all component characters (union of all sources)
+        New set of all component characters (union of all sources), owned by the caller
     """
-    normalized = normalizer(char)
-    giant_set: set[str] = set()
-
-    # CHISE: original
-    giant_set.update(get_chise_components(char, chise_ids))
-
-    # CHISE: normalized (if different)
-    if char != normalized:
-        giant_set.update(get_chise_components(normalized, chise_ids))
+    result = resolve(char, chise_components, kanjivg_components, normalizer)
 
-    # KanjiVG: original
-    giant_set.update(get_kanjivg_components(char, kanjivg_chars))
-
-    # KanjiVG: normalized (if different)
-    if char != normalized:
-        giant_set.update(get_kanjivg_components(normalized, kanjivg_chars))
+    giant_set = set(result.chise_orig)
+    giant_set.update(result.chise_norm, result.kvg_orig, result.kvg_norm)
 
     # Remove the character itself (shouldn't be its own component)
     giant_set.discard(char)
-    giant_set.discard(normalized)
+    giant_set.discard(result.normalized)
 
     return giant_set
+
+
+def make_components_expander(
+    chise_components: dict[str, frozenset[str]],
+    kanjivg_components: dict[str, frozenset[str]],
+    normalizer: Callable[[str], str],
+) -> Callable[[str], frozenset[str]]:
+    """
+    Create a memoized get_all_components_expanded for fixed component data.
+
+    Common components (水, 人, ...) are expanded once per grapheme or variant
+    that contains them, so each distinct character is only resolved once here.
+    The component tables must not be changed after the expander is created.
+
+    Args:
+        chise_components: CHISE component data
+        kanjivg_components: KanjiVG component data
+        normalizer: Normalization function (must be pure)
+
+    Returns:
+        A function mapping char -> frozenset of all its components (shared;
+        copy before modifying)
+    """
+    @functools.lru_cache(maxsize=None)
+    def expand(char: str) -> frozenset[str]:
+        return frozenset(get_all_components_expanded(char, chise_components, kanjivg_components, normalizer))
+
+    return expand
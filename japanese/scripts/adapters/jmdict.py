@@ -9,7 +9,7 @@ Uses SAX parsing for memory efficiency (the file is ~60MB).
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 from xml.sax import ContentHandler, parse as sax_parse
 from xml.sax.xmlreader import AttributesImpl
 
@@ -68,7 +68,8 @@ class JMdictHandler(ContentHandler):
         self.entries: list[JMdictEntry] = []
         self.current: Optional[JMdictEntry] = None
         self.current_sense: Optional[JMdictSense] = None
-        self.content = ""
+        # Text chunks for the current element (joined once in endElement)
+        self._content_parts: list[str] = []
 
         # Element tracking
         self.in_entry = False
@@ -82,99 +83,150 @@ class JMdictHandler(ContentHandler):
         self.in_gloss = False
         self.skip_gloss = False
 
+    def _text(self) -> str:
+        """Return the stripped text collected for the current element."""
+        return "".join(self._content_parts).strip()
+
     def startElement(self, name: str, attrs: AttributesImpl):
-        self.content = ""
+        self._content_parts.clear()
+        # Most elements are irrelevant and cost a single dict miss
+        handler = _START_HANDLERS.get(name)
+        if handler is not None:
+            handler(self, attrs)
+
+    def endElement(self, name: str):
+        handler = _END_HANDLERS.get(name)
+        if handler is not None:
+            handler(self)
+
+    # -- startElement handlers ----------------------------------------------
 
-        if name == "entry":
-            self.in_entry = True
-            self.current = JMdictEntry()
+    def _start_entry(self, attrs: AttributesImpl):
+        self.in_entry = True
+        self.current = JMdictEntry()
 
-        elif name == "ent_seq" and self.in_entry:
+    def _start_ent_seq(self, attrs: AttributesImpl):
+        if self.in_entry:
             self.in_ent_seq = True
 
-        elif name == "k_ele" and self.in_entry:
+    def _start_k_ele(self, attrs: AttributesImpl):
+        if self.in_entry:
             self.in_k_ele = True
 
-        elif name == "keb" and self.in_k_ele:
+    def _start_keb(self, attrs: AttributesImpl):
+        if self.in_k_ele:
             self.in_keb = True
 
-        elif name == "r_ele" and self.in_entry:
+    def _start_r_ele(self, attrs: AttributesImpl):
+        if self.in_entry:
             self.in_r_ele = True
 
-        elif name == "reb" and self.in_r_ele:
+    def _start_reb(self, attrs: AttributesImpl):
+        if self.in_r_ele:
             self.in_reb = True
 
-        elif name == "sense" and self.in_entry:
+    def _start_sense(self, attrs: AttributesImpl):
+        if self.in_entry:
             self.in_sense = True
             self.current_sense = JMdictSense()
 
-        elif name == "pos" and self.in_sense:
+    def _start_pos(self, attrs: AttributesImpl):
+        if self.in_sense:
             self.in_pos = True
 
-        elif name == "gloss" and self.in_sense:
-            # Only include English glosses (no xml:lang attribute or xml:lang="eng")
-            lang = attrs.get("xml:lang")
-            if lang is not None and lang != "eng":
-                self.skip_gloss = True
-            else:
-                self.in_gloss = True
-                self.skip_gloss = False
-
-    def endElement(self, name: str):
-        if name == "entry":
-            if self.current and self.current.ent_seq:
-                self.entries.append(self.current)
-            self.current = None
-            self.in_entry = False
-
-        elif name == "ent_seq":
-            if self.in_ent_seq and self.current:
-                self.current.ent_seq = self.content.strip()
-            self.in_ent_seq = False
-
-        elif name == "k_ele":
-            self.in_k_ele = False
-
-        elif name == "keb":
-            if self.in_keb and self.current:
-                text = self.content.strip()
-                if text:
-                    self.current.kanji_elements.append(text)
-            self.in_keb = False
-
-        elif name == "r_ele":
-            self.in_r_ele = False
-
-        elif name == "reb":
-            if self.in_reb and self.current:
-                text = self.content.strip()
-                if text:
-                    self.current.reading_elements.append(text)
-            self.in_reb = False
-
-        elif name == "sense":
-            if self.in_sense and self.current and self.current_sense:
-                self.current.senses.append(self.current_sense)
-            self.current_sense = None
-            self.in_sense = False
-
-        elif name == "pos":
-            if self.in_pos and self.current_sense:
-                text = self.content.strip()
-                if text:
-                    self.current_sense.pos.append(text)
-            self.in_pos = False
-
-        elif name == "gloss":
-            if self.in_gloss and self.current_sense:
-                text = self.content.strip()
-                if text:
-                    self.current_sense.glosses.append(text)
-            self.in_gloss = False
+    def _start_gloss(self, attrs: AttributesImpl):
+        if not self.in_sense:
+            return
+        # Only include English glosses (no xml:lang attribute or xml:lang="eng")
+        lang = attrs.get("xml:lang")
+        if lang is not None and lang != "eng":
+            self.skip_gloss = True
+        else:
+            self.in_gloss = True
             self.skip_gloss = False
 
+    # -- endElement handlers ------------------------------------------------
+
+    def _end_entry(self):
+        if self.current and self.current.ent_seq:
+            self.entries.append(self.current)
+        self.current = None
+        self.in_entry = False
+
+    def _end_ent_seq(self):
+        if self.in_ent_seq and self.current:
+            self.current.ent_seq = self._text()
+        self.in_ent_seq = False
+
+    def _end_k_ele(self):
+        self.in_k_ele = False
+
+    def _end_keb(self):
+        if self.in_keb and self.current:
+            text = self._text()
+            if text:
+                self.current.kanji_elements.append(text)
+        self.in_keb = False
+
+    def _end_r_ele(self):
+        self.in_r_ele = False
+
+    def _end_reb(self):
+        if self.in_reb and self.current:
+            text = self._text()
+            if text:
+                self.current.reading_elements.append(text)
+        self.in_reb = False
+
+    def _end_sense(self):
+        if self.in_sense and self.current and self.current_sense:
+            self.current.senses.append(self.current_sense)
+        self.current_sense = None
+        self.in_sense = False
+
+    def _end_pos(self):
+        if self.in_pos and self.current_sense:
+            text = self._text()
+            if text:
+                self.current_sense.pos.append(text)
+        self.in_pos = False
+
+    def _end_gloss(self):
+        if self.in_gloss and self.current_sense:
+            text = self._text()
+            if text:
+                self.current_sense.glosses.append(text)
+        self.in_gloss = False
+        self.skip_gloss = False
+
     def characters(self, content: str):
-        self.content += content
+        self._content_parts.append(content)
+
+
+# Element name -> JMdictHandler callback, looked up once per SAX event
+_START_HANDLERS: dict[str, Callable[[JMdictHandler, AttributesImpl], None]] = {
+    "entry": JMdictHandler._start_entry,
+    "ent_seq": JMdictHandler._start_ent_seq,
+    "k_ele": JMdictHandler._start_k_ele,
+    "keb": JMdictHandler._start_keb,
+    "r_ele": JMdictHandler._start_r_ele,
+    "reb": JMdictHandler._start_reb,
+    "sense": JMdictHandler._start_sense,
+    "pos": JMdictHandler._start_pos,
+    "gloss": JMdictHandler._start_gloss,
+}
+
+_END_HANDLERS: dict[str, Callable[[JMdictHandler], None]] = {
+    "entry": JMdictHandler._end_entry,
+    "ent_seq": JMdictHandler._end_ent_seq,
+    "k_ele": JMdictHandler._end_k_ele,
+    "keb": JMdictHandler._end_keb,
+    "r_ele": JMdictHandler._end_r_ele,
+    "reb": JMdictHandler._end_reb,
+    "sense": JMdictHandler._end_sense,
+    "pos": JMdictHandler._end_pos,
+    "gloss": JMdictHandler._end_gloss,
+}
 
 
 def parse_jmdict(path: Path = JMDICT_PATH) -> list[JMdictEntry]:
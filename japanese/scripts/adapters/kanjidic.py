@@ -6,20 +6,29 @@ Parse kanjidic2.xml to extract kanji entries.
 Consolidates parsing logic used by multiple scripts.
 """
 
+import pickle
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
-from xml.sax import ContentHandler, parse as sax_parse
-from xml.sax.xmlreader import AttributesImpl
+from xml.etree.ElementTree import Element
+
+# Optional C-accelerated iterparse (falls back to stdlib ElementTree)
+try:
+    from lxml.etree import iterparse
+except ImportError:
+    from xml.etree.ElementTree import iterparse
 
 # Add parent directory to path for lib imports
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from lib.paths import KANJIDIC_PATH
 
+# Bump when KanjiEntry or the parsing logic changes to invalidate caches
+_CACHE_VERSION = 2
+
 
-@dataclass
+@dataclass(slots=True)
 class KanjiEntry:
     """A parsed kanji entry from kanjidic2.xml."""
     literal: str = ""
@@ -30,145 +39,99 @@ class KanjiEntry:
     kunyomi: list[str] = field(default_factory=list)
 
 
-class KanjidictFullHandler(ContentHandler):
+def _parse_int(text: Optional[str]) -> Optional[int]:
+    """Parse element text as an int, returning None if missing or invalid."""
+    if text is None:
+        return None
+    try:
+        return int(text.strip())
+    except ValueError:
+        return None
+
+
+def _parse_character(elem: Element) -> KanjiEntry:
+    """Build a KanjiEntry from a <character> element."""
+    entry = KanjiEntry()
+    entry.literal = (elem.findtext("literal") or "").strip()
+
+    misc = elem.find("misc")
+    if misc is not None:
+        # Only take the first stroke_count (primary count)
+        entry.stroke_count = _parse_int(misc.findtext("stroke_count"))
+        entry.grade = _parse_int(misc.findtext("grade"))
+
+    for rmgroup in elem.iterfind("reading_meaning/rmgroup"):
+        for reading in rmgroup.iterfind("reading"):
+            text = (reading.text or "").strip()
+            if not text:
+                continue
+            r_type = reading.get("r_type")
+            if r_type == "ja_on":
+                entry.onyomi.append(text)
+            elif r_type == "ja_kun":
+                entry.kunyomi.append(text)
+
+        for meaning in rmgroup.iterfind("meaning"):
+            text = (meaning.text or "").strip()
+            # Only English meanings (no m_lang attribute)
+            if text and meaning.get("m_lang") is None:
+                entry.meanings.append(text)
+
+    return entry
+
+
+def _parse_kanjidic_xml(path: Path) -> list[KanjiEntry]:
     """
-    SAX handler for parsing kanjidic2.xml.
+    Stream kanjidic2.xml with iterparse, building one entry per <character>
+    element and clearing it afterwards to keep memory bounded.
 
-    Extracts kanji characters with stroke counts, grade, meanings, and readings.
+    Uses lxml's iterparse when installed; its elements support the same
+    find/findtext/iterfind/get calls as ElementTree.
     """
+    entries: list[KanjiEntry] = []
 
-    def __init__(self):
-        super().__init__()
-        self.entries: list[KanjiEntry] = []
-        self.current: Optional[KanjiEntry] = None
-        self.content = ""
-
-        # Element tracking
-        self.in_character = False
-        self.in_literal = False
-        self.in_misc = False
-        self.in_stroke_count = False
-        self.in_grade = False
-        self.in_reading_meaning = False
-        self.in_rmgroup = False
-        self.in_reading = False
-        self.in_meaning = False
-        self.got_stroke_count = False
-
-        # Attribute tracking for current element
-        self.current_reading_type: Optional[str] = None
-        self.current_meaning_lang: Optional[str] = None
-
-    def startElement(self, name: str, attrs: AttributesImpl):
-        self.content = ""
-
-        if name == "character":
-            self.in_character = True
-            self.current = KanjiEntry()
-            self.got_stroke_count = False
-
-        elif name == "literal" and self.in_character:
-            self.in_literal = True
-
-        elif name == "misc" and self.in_character:
-            self.in_misc = True
-
-        elif name == "stroke_count" and self.in_misc:
-            self.in_stroke_count = True
-
-        elif name == "grade" and self.in_misc:
-            self.in_grade = True
-
-        elif name == "reading_meaning" and self.in_character:
-            self.in_reading_meaning = True
-
-        elif name == "rmgroup" and self.in_reading_meaning:
-            self.in_rmgroup = True
-
-        elif name == "reading" and self.in_rmgroup:
-            self.in_reading = True
-            self.current_reading_type = attrs.get("r_type")
-
-        elif name == "meaning" and self.in_rmgroup:
-            self.in_meaning = True
-            self.current_meaning_lang = attrs.get("m_lang")
-
-    def endElement(self, name: str):
-        if name == "character":
-            if self.current and self.current.literal:
-                self.entries.append(self.current)
-            self.current = None
-            self.in_character = False
-
-        elif name == "literal":
-            if self.in_literal and self.current:
-                self.current.literal = self.content.strip()
-            self.in_literal = False
-
-        elif name == "misc":
-            self.in_misc = False
-
-        elif name == "stroke_count":
-            if self.in_stroke_count and self.current and not self.got_stroke_count:
-                # Only take the first stroke_count (primary count)
-                try:
-                    self.current.stroke_count = int(self.content.strip())
-                    self.got_stroke_count = True
-                except ValueError:
-                    pass
-            self.in_stroke_count = False
-
-        elif name == "grade":
-            if self.in_grade and self.current:
-                try:
-                    self.current.grade = int(self.content.strip())
-                except ValueError:
-                    pass
-            self.in_grade = False
-
-        elif name == "reading_meaning":
-            self.in_reading_meaning = False
-
-        elif name == "rmgroup":
-            self.in_rmgroup = False
-
-        elif name == "reading":
-            if self.in_reading and self.current:
-                text = self.content.strip()
-                if text:
-                    if self.current_reading_type == "ja_on":
-                        self.current.onyomi.append(text)
-                    elif self.current_reading_type == "ja_kun":
-                        self.current.kunyomi.append(text)
-            self.in_reading = False
-            self.current_reading_type = None
-
-        elif name == "meaning":
-            if self.in_meaning and self.current:
-                text = self.content.strip()
-                # Only English meanings (no m_lang attribute)
-                if text and self.current_meaning_lang is None:
-                    self.current.meanings.append(text)
-            self.in_meaning = False
-            self.current_meaning_lang = None
-
-    def characters(self, content: str):
-        self.content += content
+    for _, elem in iterparse(str(path), events=("end",)):
+        if elem.tag != "character":
+            continue
+        entry = _parse_character(elem)
+        if entry.literal:
+            entries.append(entry)
+        elem.clear()
+
+    return entries
 
 
 def parse_kanjidic_full(path: Path = KANJIDIC_PATH) -> list[KanjiEntry]:
     """
     Parse kanjidic2.xml and extract full kanji entries.
 
+    Parsed entries are cached next to the source as <name>.cache.pkl and
+    reused while the cache is newer than the XML file.
+
     Args:
         path: Path to kanjidic2.xml file
 
     Returns:
         List of KanjiEntry objects
     """
-    handler = KanjidictFullHandler()
-    sax_parse(str(path), handler)
-    return handler.entries
+    cache_path = path.with_suffix(".cache.pkl")
+
+    if cache_path.exists() and cache_path.stat().st_mtime >= path.stat().st_mtime:
+        try:
+            version, entries = pickle.loads(cache_path.read_bytes())
+            if version == _CACHE_VERSION:
+                return entries
+        except Exception:
+            pass  # Unreadable or incompatible cache, re-parse
+
+    entries = _parse_kanjidic_xml(path)
+
+    try:
+        cache_path.write_bytes(pickle.dumps((_CACHE_VERSION, entries), protocol=5))
+    except OSError:
+        pass  # Caching is best-effort
+
+    return entries
 
 
 # ---------------------------------------------------------------------------
@@ -185,11 +148,9 @@ def parse_kanjidic(path: Path = KANJIDIC_PATH) -> list[tuple[str, int]]:
     Returns:
         List of (kanji_char, stroke_count) tuples
     """
-    handler = KanjidictFullHandler()
-    sax_parse(str(path), handler)
     return [
         (e.literal, e.stroke_count)
-        for e in handler.entries
+        for e in parse_kanjidic_full(path)
         if e.stroke_count is not None
     ]
 
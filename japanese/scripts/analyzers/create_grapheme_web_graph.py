@@ -4,24 +4,34 @@ visualize_grapheme_graph.py
 
 Creates a layered graph visualization of grapheme composition relationships.
 Generates an HTML file with CSS Grid for layout and SVG for edges.
-Each tree is separate, layers are strict horizontal bands by stroke count.
+Each tree is separate, layers are strict horizontal bands by stroke count
+(or by dependency depth with --by-depth).
 Nodes are ordered by barycentric heuristic to minimize edge crossings.
+With --gz the page is written gzip-compressed to grapheme-graph.html.gz.
 
 Usage:
-    python UL-Content/japanese/scripts/analyzers/grapheme_graph.py
+    python UL-Content/japanese/scripts/analyzers/grapheme_graph.py [--by-depth] [--gz]
 """
 
+import argparse
+import gzip
 import html
+import io
 import json
 import sys
-from collections import defaultdict
+from array import array
+from collections import defaultdict, deque
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
+from statistics import median
+from typing import Iterable, TextIO
 
 # Add parent directory to path for lib imports
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from lib.paths import REPORTS_DIR
-from lib.grapheme_io import load_graphemes, load_dependencies
+from lib.grapheme_io import load_graphemes, load_dependencies, read_json_document
 
 OUTPUT_FILE = REPORTS_DIR / "grapheme-graph.html"
 POPULARITY_JSON = REPORTS_DIR / "component-popularity.json"
@@ -31,32 +41,53 @@ def load_popularity_data() -> dict | None:
     """Load popularity data from JSON file if it exists."""
     if not POPULARITY_JSON.exists():
         return None
-    with open(POPULARITY_JSON, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return read_json_document(POPULARITY_JSON)
 
 
 def find_connected_components(all_nodes: set[str], deps: dict[str, list[str]], reverse_deps: dict[str, list[str]]) -> list[set[str]]:
-    """Find all connected components (trees) in the graph."""
-    visited = set()
-    components = []
-
-    def dfs(node: str, component: set[str]):
-        if node in visited:
-            return
-        visited.add(node)
-        component.add(node)
-        for child in deps.get(node, []):
-            dfs(child, component)
-        for parent in reverse_deps.get(node, []):
-            dfs(parent, component)
-
-    for node in all_nodes:
-        if node not in visited:
-            component = set()
-            dfs(node, component)
-            components.append(component)
+    """
+    Find all connected components (trees) in the graph.
 
-    return sorted(components, key=len, reverse=True)
+    Uses union-find with path halving and union by rank over the dependency
+    edges. reverse_deps holds the same edges reversed, so deps alone is
+    enough to join every tree.
+    """
+    nodes = list(all_nodes)
+    index = {node: i for i, node in enumerate(nodes)}
+    parent = list(range(len(nodes)))
+    rank = [0] * len(nodes)
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    index_get = index.get
+
+    for node, components in deps.items():
+        i = index_get(node)
+        if i is None:
+            continue
+        for component in components:
+            j = index_get(component)
+            if j is None:
+                continue
+            root_a, root_b = find(i), find(j)
+            if root_a == root_b:
+                continue
+            if rank[root_a] < rank[root_b]:
+                root_a, root_b = root_b, root_a
+            parent[root_b] = root_a
+            if rank[root_a] == rank[root_b]:
+                rank[root_a] += 1
+
+    # Group by root; dict order keeps trees in first-seen order for ties
+    trees: dict[int, set[str]] = defaultdict(set)
+    for i, node in enumerate(nodes):
+        trees[find(i)].add(node)
+
+    return sorted(trees.values(), key=len, reverse=True)
 
 
 def get_stroke_count(grapheme_id: str, graphemes: dict[str, dict]) -> int:
@@ -66,6 +97,48 @@ def get_stroke_count(grapheme_id: str, graphemes: dict[str, dict]) -> int:
     return 999
 
 
+def compute_depth_layers(nodes: Iterable[str], deps: dict[str, list[str]], reverse_deps: dict[str, list[str]]) -> dict[str, int]:
+    """
+    Assign each node its longest-path depth with Kahn's algorithm.
+
+    Primitives (no components among nodes) are layer 1, and every other
+    grapheme sits one layer below its deepest component. This is the
+    shortest layering in which all edges point downwards. Nodes on a
+    dependency cycle never become ready and get the 999 "Unknown" layer.
+    """
+    node_set = set(nodes)
+    pending = {node: sum(1 for c in deps.get(node, ()) if c in node_set) for node in node_set}
+    depth = dict.fromkeys(node_set, 1)
+
+    ready = deque(node for node, count in pending.items() if count == 0)
+    while ready:
+        node = ready.popleft()
+        for parent in reverse_deps.get(node, ()):
+            if parent not in node_set:
+                continue
+            if depth[node] + 1 > depth[parent]:
+                depth[parent] = depth[node] + 1
+            pending[parent] -= 1
+            if pending[parent] == 0:
+                ready.append(parent)
+
+    for node, count in pending.items():
+        if count:
+            depth[node] = 999
+
+    return depth
+
+
+def group_by_stroke(nodes: Iterable[str], stroke_of: dict[str, int]) -> dict[int, list[str]]:
+    """
+    Group nodes into layers by stroke count, in ascending stroke order.
+
+    The sort is stable, so nodes keep their input order within a layer.
+    """
+    key = stroke_of.__getitem__
+    return {strokes: list(group) for strokes, group in groupby(sorted(nodes, key=key), key=key)}
+
+
 def node_id_safe(grapheme_id: str) -> str:
     """Convert grapheme ID to a safe HTML/CSS id."""
     return grapheme_id.replace(":", "_").replace("+", "_")
@@ -101,6 +174,19 @@ def compute_layer_ordering(
     """
     ordered = {}
 
+    # Sort by child count desc, then parent count desc, then symbol for ties.
+    # Keys are computed once per node up front rather than inside each sort.
+    sort_keys = {
+        gid: (
+            -len(reverse_deps.get(gid, ())),
+            -len(deps.get(gid, ())),
+            graphemes.get(gid, {}).get("symbol", ""),
+        )
+        for strokes in stroke_counts
+        for gid in by_strokes[strokes]
+    }
+    sort_key = sort_keys.__getitem__
+
     for strokes in stroke_counts:
         layer_nodes = by_strokes[strokes]
 
@@ -120,15 +206,6 @@ def compute_layer_ordering(
             else:
                 finals.append(gid)
 
-        def child_count(gid):
-            return len(reverse_deps.get(gid, []))
-
-        def parent_count(gid):
-            return len(deps.get(gid, []))
-
-        # Sort by child count desc, then parent count desc, then symbol for ties
-        sort_key = lambda x: (-child_count(x), -parent_count(x), graphemes.get(x, {}).get("symbol", ""))
-
         primitives_sorted = sorted(primitives, key=sort_key)
         composites_sorted = sorted(composites, key=sort_key)
         finals_sorted = sorted(finals, key=sort_key)
@@ -138,6 +215,69 @@ def compute_layer_ordering(
     return ordered
 
 
+def sweep_layer_ordering(
+    ordered: dict[int, tuple[list[str], list[str], list[str]]],
+    stroke_counts: list[int],
+    deps: dict[str, list[str]],
+    reverse_deps: dict[str, list[str]],
+    passes: int = 4,
+) -> dict[int, tuple[list[str], list[str], list[str]]]:
+    """
+    Refine a layer ordering with median sweeps to reduce edge crossings.
+
+    Passes alternate top-down and bottom-up. Each pass re-sorts every
+    category of a layer by the median position of the node's neighbours in
+    the layers already swept: components on the way down, parents on the
+    way up. Nodes without such neighbours keep their current position. The
+    sorts are stable, so categories stay in place and the child-count order
+    from compute_layer_ordering is the starting point.
+    """
+    # Tree-local adjacency as CSR arrays (indptr, indices) over node
+    # indices, built once so the passes below only do index arithmetic
+    local: dict[str, int] = {}
+    for strokes in stroke_counts:
+        for category in ordered[strokes]:
+            for gid in category:
+                local[gid] = len(local)
+    local_get = local.get
+
+    def to_csr(adjacency: dict[str, list[str]]) -> tuple[array, array]:
+        indptr, indices = array("i", [0]), array("i")
+        for gid in local:
+            indices.extend(j for j in map(local_get, adjacency.get(gid, ())) if j is not None)
+            indptr.append(len(indices))
+        return indptr, indices
+
+    down, up = to_csr(deps), to_csr(reverse_deps)
+    pos = [0.0] * len(local)
+
+    def place(strokes: int):
+        layer = [local[gid] for category in ordered[strokes] for gid in category]
+        last = len(layer) - 1
+        for i, node in enumerate(layer):
+            pos[node] = i / last if last else 0.5
+
+    for strokes in stroke_counts:
+        place(strokes)
+
+    for sweep in range(passes):
+        if sweep % 2 == 0:
+            layers, (indptr, indices) = stroke_counts[1:], down
+        else:
+            layers, (indptr, indices) = stroke_counts[-2::-1], up
+
+        def median_key(gid: str) -> float:
+            node = local[gid]
+            around = [pos[j] for j in indices[indptr[node]:indptr[node + 1]]]
+            return median(around) if around else pos[node]
+
+        for strokes in layers:
+            ordered[strokes] = tuple(sorted(category, key=median_key) for category in ordered[strokes])
+            place(strokes)
+
+    return ordered
+
+
 def generate_popularity_view(graphemes: dict[str, dict], popularity_data: dict) -> str:
     """Generate the popularity view HTML showing graphemes sorted by popularity."""
     if not popularity_data:
@@ -148,17 +288,24 @@ def generate_popularity_view(graphemes: dict[str, dict], popularity_data: dict)
 
     for entry in popularity_data.get("entries", []):
         if entry.get("is_grapheme"):
+            # Fill in missing popularity once so the sort can use itemgetter
+            entry.setdefault("popularity", -1)
             stroke = entry.get("stroke_count", 999)
             by_strokes[stroke].append(entry)
 
     # Sort each group by popularity descending
+    by_popularity = itemgetter("popularity")
     for stroke in by_strokes:
-        by_strokes[stroke].sort(key=lambda e: e.get("popularity", -1), reverse=True)
+        by_strokes[stroke].sort(key=by_popularity, reverse=True)
 
     # Find max nodes in any layer
     max_nodes = max(len(by_strokes[s]) for s in by_strokes) if by_strokes else 1
     total_layer_width = max(max_nodes * 70, 400)
 
+    # Local aliases for the per-node loop
+    escape = html.escape
+    graphemes_get = graphemes.get
+
     layers_html = []
     for strokes in sorted(by_strokes.keys()):
         entries = by_strokes[strokes]
@@ -170,14 +317,15 @@ def generate_popularity_view(graphemes: dict[str, dict], popularity_data: dict)
         nodes_html = []
         for i, entry in enumerate(entries):
             char = entry.get("char", "?")
-            symbol = html.escape(char)
+            symbol = escape(char)
             grapheme_id = entry.get("grapheme_id", "")
             popularity = entry.get("popularity", -1)
 
             # Try to get name from graphemes dict
             name = ""
-            if grapheme_id and grapheme_id in graphemes:
-                name = html.escape(graphemes[grapheme_id].get("name", ""))
+            g = graphemes_get(grapheme_id) if grapheme_id else None
+            if g is not None:
+                name = escape(g.get("name", ""))
 
             if total_nodes > 1:
                 left_pct = (i / (total_nodes - 1)) * 100
@@ -187,13 +335,10 @@ def generate_popularity_view(graphemes: dict[str, dict], popularity_data: dict)
             pop_str = str(popularity) if popularity >= 0 else "N/A"
             pop_badge = f'<span class="badge pop-count">{pop_str}</span>'
 
-            nodes_html.append(f'''
-                <div class="node pop-node" style="left: {left_pct:.2f}%;" title="{symbol} - popularity: {pop_str}">
-                    {pop_badge}
-                    <span class="symbol">{symbol}</span>
-                    <span class="name">{name}</span>
-                </div>
-            ''')
+            nodes_html.append(
+                f'<div class="node pop-node" style="left: {left_pct:.1f}%;" title="{symbol} - popularity: {pop_str}">'
+                f'{pop_badge}<span class="symbol">{symbol}</span><span class="name">{name}</span></div>'
+            )
 
         layers_html.append(f'''
             <div class="layer" style="background-color: {bg_color};">
@@ -228,203 +373,35 @@ def generate_popularity_view(graphemes: dict[str, dict], popularity_data: dict)
     '''
 
 
-def generate_html(trees: list[set[str]], graphemes: dict[str, dict], deps: dict[str, list[str]], reverse_deps: dict[str, list[str]], orphans: set[str] = None, popularity_data: dict = None) -> str:
-    """Generate the complete HTML document."""
-
-    # Generate popularity view HTML
-    popularity_html = generate_popularity_view(graphemes, popularity_data)
-
-    # Collect all edges for JavaScript
-    all_edges = []
-    for tree_nodes in trees:
-        for parent_id in tree_nodes:
-            if parent_id in deps:
-                for component_id in deps[parent_id]:
-                    if component_id in tree_nodes:
-                        all_edges.append((node_id_safe(component_id), node_id_safe(parent_id)))
-
-    edges_json = json.dumps(all_edges)
-
-    # Build tree HTML
-    trees_html = []
-    for tree_idx, tree_nodes in enumerate(trees):
-        by_strokes = defaultdict(list)
-        for gid in tree_nodes:
-            strokes = get_stroke_count(gid, graphemes)
-            by_strokes[strokes].append(gid)
-
-        stroke_counts = sorted(by_strokes.keys())
-
-        # Compute layer ordering (by child count within each category)
-        ordered_layers = compute_layer_ordering(
-            by_strokes, stroke_counts, deps, reverse_deps, graphemes
-        )
-
-        # Find max total nodes in any layer (determines overall width)
-        max_total_nodes = max(
-            len(ordered_layers[s][0]) + len(ordered_layers[s][1]) + len(ordered_layers[s][2])
-            for s in stroke_counts
-        )
-        # 70px per node slot + padding on edges
-        total_layer_width = max(max_total_nodes * 70, 400)
-
-        layers_html = []
-        for strokes in stroke_counts:
-            primitives, composites, finals = ordered_layers[strokes]
-            all_nodes = primitives + composites + finals
-            total_nodes = len(all_nodes)
-
-            stroke_label = f"{strokes} stroke{'s' if strokes != 1 else ''}" if strokes != 999 else "Unknown"
-            bg_color = stroke_color(strokes)
-
-            # Build all nodes with positions across the full layer
-            nodes_html = []
-            for i, gid in enumerate(all_nodes):
-                g = graphemes.get(gid, {})
-                symbol = html.escape(g.get("symbol", "?"))
-                name = html.escape(g.get("name", "?"))
-                safe_id = node_id_safe(gid)
-
-                # Calculate position as percentage across full layer
-                if total_nodes > 1:
-                    left_pct = (i / (total_nodes - 1)) * 100
-                else:
-                    left_pct = 50
-
-                # Count parents (components this grapheme uses) and children (graphemes that use this)
-                parent_count = len(deps.get(gid, []))
-                child_count = len(reverse_deps.get(gid, []))
-
-                parent_badge = f'<span class="badge parent-count">{parent_count}</span>' if parent_count > 0 else ''
-                child_badge = f'<span class="badge child-count">{child_count}</span>' if child_count > 0 else ''
-
-                nodes_html.append(f'''
-                    <div class="node" id="{safe_id}" style="left: {left_pct:.2f}%;" title="{symbol} - {name}">
-                        {parent_badge}
-                        <span class="symbol">{symbol}</span>
-                        <span class="name">{name}</span>
-                        {child_badge}
-                    </div>
-                ''')
-
-            layers_html.append(f'''
-                <div class="layer" style="background-color: {bg_color};">
-                    <div class="layer-label">{stroke_label}</div>
-                    <div class="layer-content" style="width: {total_layer_width}px;">
-                        <div class="nodes-container">
-                            {''.join(nodes_html)}
-                        </div>
-                    </div>
-                </div>
-            ''')
-
-        trees_html.append(f'''
-            <div class="tree">
-                <div class="tree-header">Tree {tree_idx + 1} ({len(tree_nodes)} graphemes)</div>
-                <div class="tree-content">
-                    <div class="tree-layers" data-tree="{tree_idx}">
-                        <svg class="edges" data-tree="{tree_idx}"></svg>
-                        {''.join(layers_html)}
-                    </div>
-                </div>
-            </div>
-        ''')
-
-    # Add orphans tree if there are any
-    if orphans:
-        by_strokes = defaultdict(list)
-        for gid in orphans:
-            strokes = get_stroke_count(gid, graphemes)
-            by_strokes[strokes].append(gid)
-
-        stroke_counts = sorted(by_strokes.keys())
-
-        # Find max nodes in any layer
-        max_total_nodes = max(len(by_strokes[s]) for s in stroke_counts)
-        total_layer_width = max(max_total_nodes * 70, 400)
-
-        layers_html = []
-        for strokes in stroke_counts:
-            layer_nodes = sorted(by_strokes[strokes], key=lambda x: graphemes.get(x, {}).get("symbol", ""))
-            total_nodes = len(layer_nodes)
-
-            stroke_label = f"{strokes} stroke{'s' if strokes != 1 else ''}" if strokes != 999 else "Unknown"
-            bg_color = stroke_color(strokes)
-
-            nodes_html = []
-            for i, gid in enumerate(layer_nodes):
-                g = graphemes.get(gid, {})
-                symbol = html.escape(g.get("symbol", "?"))
-                name = html.escape(g.get("name", "?"))
-                safe_id = node_id_safe(gid)
-
-                if total_nodes > 1:
-                    left_pct = (i / (total_nodes - 1)) * 100
-                else:
-                    left_pct = 50
-
-                nodes_html.append(f'''
-                    <div class="node" id="{safe_id}" style="left: {left_pct:.2f}%;" title="{symbol} - {name}">
-                        <span class="symbol">{symbol}</span>
-                        <span class="name">{name}</span>
-                    </div>
-                ''')
-
-            layers_html.append(f'''
-                <div class="layer" style="background-color: {bg_color};">
-                    <div class="layer-label">{stroke_label}</div>
-                    <div class="layer-content" style="width: {total_layer_width}px;">
-                        <div class="nodes-container">
-                            {''.join(nodes_html)}
-                        </div>
-                    </div>
-                </div>
-            ''')
-
-        trees_html.append(f'''
-            <div class="tree orphans-tree">
-                <div class="tree-header">Orphans ({len(orphans)} graphemes with no relationships)</div>
-                <div class="tree-content">
-                    <div class="tree-layers" data-tree="orphans">
-                        {''.join(layers_html)}
-                    </div>
-                </div>
-            </div>
-        ''')
-
-    return f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Grapheme Composition Graph</title>
-    <style>
-        * {{
+# Static page CSS and JavaScript. Kept out of the generate_html f-string so
+# they need no brace escaping and are not re-interpolated on every call.
+_PAGE_CSS = """\
+        * {
             box-sizing: border-box;
             margin: 0;
             padding: 0;
-        }}
+        }
 
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
             background: #f0f0f0;
             padding: 20px;
-        }}
+        }
 
-        h1 {{
+        h1 {
             text-align: center;
             margin-bottom: 10px;
             color: #333;
-        }}
+        }
 
-        .tab-buttons {{
+        .tab-buttons {
             display: flex;
             justify-content: center;
             gap: 10px;
             margin-bottom: 20px;
-        }}
+        }
 
-        .tab-btn {{
+        .tab-btn {
             padding: 10px 24px;
             font-size: 14px;
             font-weight: 600;
@@ -434,145 +411,149 @@ def generate_html(trees: list[set[str]], graphemes: dict[str, dict], deps: dict[
             color: #666;
             cursor: pointer;
             transition: all 0.2s;
-        }}
+        }
 
-        .tab-btn:hover {{
+        .tab-btn:hover {
             border-color: #999;
             color: #333;
-        }}
+        }
 
-        .tab-btn.active {{
+        .tab-btn.active {
             background: #333;
             border-color: #333;
             color: #fff;
-        }}
+        }
 
-        .tab-content {{
+        .tab-content {
             display: none;
-        }}
+        }
 
-        .tab-content.active {{
+        .tab-content.active {
             display: block;
-        }}
+        }
 
-        .popularity-header {{
+        .popularity-header {
             text-align: center;
             margin-bottom: 20px;
             color: #666;
-        }}
+        }
 
-        .popularity-header .stats {{
+        .popularity-header .stats {
             font-size: 12px;
             margin-top: 5px;
-        }}
+        }
 
-        .no-data {{
+        .no-data {
             text-align: center;
             padding: 40px;
             color: #666;
             font-style: italic;
-        }}
+        }
 
-        .pop-node .pop-count {{
+        .pop-node .pop-count {
             top: -5px;
             left: 50%;
             transform: translateX(-50%);
             background: #E65100;
             color: #fff;
-        }}
+        }
 
-        .container {{
-        }}
+        .container {
+        }
 
-        .tree-layers {{
+        .tree-layers {
             display: inline-block;
             min-width: 100%;
             position: relative;
             padding: 15px;
-        }}
+        }
 
-        svg.edges {{
+        svg.edges {
             position: absolute;
             top: 0;
             left: 0;
             pointer-events: none;
             z-index: 2;
-        }}
+        }
 
-        .tree {{
+        .tree {
             background: #fff;
             border-radius: 8px;
             margin-bottom: 30px;
             box-shadow: 0 2px 8px rgba(0,0,0,0.1);
             overflow: hidden;
-        }}
+        }
 
-        .tree-header {{
+        .tree-header {
             background: #333;
             color: #fff;
             padding: 12px 20px;
             font-size: 16px;
             font-weight: 600;
-        }}
+        }
 
-        .orphans-tree .tree-header {{
+        .orphans-tree .tree-header {
             background: #757575;
-        }}
+        }
 
-        .tree-content {{
+        .tree-content {
             padding: 0;
             overflow-x: auto;
-        }}
+        }
 
-        .layer {{
+        .layer {
             display: flex;
             align-items: center;
             padding: 20px 20px;
             margin-bottom: 15px;
             border-radius: 6px;
             min-height: 80px;
-        }}
+        }
 
-        .layer:last-child {{
+        .layer:last-child {
             margin-bottom: 0;
-        }}
+        }
 
-        .layer-label {{
+        .layer-label {
             width: 100px;
             flex-shrink: 0;
             font-size: 12px;
             font-weight: 600;
             color: #666;
-        }}
+        }
 
-        .layer-content {{
+        .layer-content {
             position: relative;
             height: 70px;
             flex-shrink: 0;
-        }}
+        }
 
-        .nodes-container {{
+        .nodes-container {
             position: absolute;
             top: 0;
             left: 30px;   /* Padding so edge nodes don't overflow */
             right: 30px;
             bottom: 0;
             z-index: 3;
-        }}
+        }
 
-        svg.edges path {{
+        svg.edges path {
             opacity: 0.06;
             stroke: #999;
             stroke-width: 1.5;
-        }}
+        }
+
+        svg.edges path.bulk {
+            shape-rendering: optimizeSpeed;
+        }
 
-        svg.edges path.highlighted {{
+        svg.edges path.highlighted {
             opacity: 0.9;
             stroke: #2196F3;
             stroke-width: 2;
-        }}
+        }
 
-        .node {{
+        .node {
             position: absolute;
             top: 50%;
             transform: translate(-50%, -50%);
@@ -584,24 +565,24 @@ def generate_html(trees: list[set[str]], graphemes: dict[str, dict], deps: dict[
             width: 60px;
             cursor: default;
             transition: border-color 0.15s, box-shadow 0.15s;
-        }}
+        }
 
-        .node:hover {{
+        .node:hover {
             border-color: #666;
             box-shadow: 0 2px 8px rgba(0,0,0,0.15);
             z-index: 20;
-        }}
+        }
 
-        .node .symbol {{
+        .node .symbol {
             display: block;
             font-size: 18px;
             font-family: "Noto Sans CJK JP", "Hiragino Sans", sans-serif;
             line-height: 1.2;
             cursor: text;
             user-select: text;
-        }}
+        }
 
-        .node .name {{
+        .node .name {
             display: block;
             font-size: 7px;
             color: #666;
@@ -615,9 +596,9 @@ def generate_html(trees: list[set[str]], graphemes: dict[str, dict], deps: dict[
             max-height: 2.4em;  /* 2 lines max */
             cursor: text;
             user-select: text;
-        }}
+        }
 
-        .node .badge {{
+        .node .badge {
             position: absolute;
             font-size: 9px;
             font-weight: 600;
@@ -627,68 +608,81 @@ def generate_html(trees: list[set[str]], graphemes: dict[str, dict], deps: dict[
             text-align: center;
             border-radius: 7px;
             padding: 0 3px;
-        }}
+        }
 
-        .node .parent-count {{
+        .node .parent-count {
             top: -5px;
             left: -5px;
             background: #7B1FA2;
             color: #fff;
-        }}
+        }
 
-        .node .child-count {{
+        .node .child-count {
             bottom: -5px;
             right: -5px;
             background: #1976D2;
             color: #fff;
-        }}
+        }
 
-        .node.highlighted {{
+        .node.highlighted {
             border-color: #2196F3;
             box-shadow: 0 0 0 3px rgba(33, 150, 243, 0.3);
             z-index: 20;
-        }}
+        }
 
-        .node.faded {{
+        /* While a node is selected, fade everything outside its neighbourhood */
+        .container.has-selection .node:not(.selected):not(.connected) {
             opacity: 0.15;
-        }}
+        }
 
-        .node.selected {{
+        .node.selected {
             border-color: #1976D2;
             box-shadow: 0 0 0 4px rgba(25, 118, 210, 0.4);
             z-index: 21;
-        }}
+        }
 
-        svg.edges path.faded {{
+        .container.has-selection svg.edges path.bulk {
             opacity: 0.02;
-        }}
-    </style>
-</head>
-<body>
-    <h1>Grapheme Composition Graph</h1>
+        }
+"""
 
-    <div class="tab-buttons">
-        <button class="tab-btn active" data-tab="composition">Composition Trees</button>
-        <button class="tab-btn" data-tab="popularity">Popularity View</button>
-    </div>
+_PAGE_SCRIPT = """\
+        const SVG_NS = 'http://www.w3.org/2000/svg';
+        let currentHoveredNode = null;
+        let pendingClear = null;
+        let selectedNode = null;
+        const container = document.getElementById('container');
 
-    <div id="composition-tab" class="tab-content active">
-        <div class="container" id="container">
-            {''.join(trees_html)}
-        </div>
-    </div>
+        // Drawn edges ({from, to, d, svg}) indexed by both endpoint ids
+        let edgesByNode = new Map();
 
-    <div id="popularity-tab" class="tab-content">
-        {popularity_html}
-    </div>
+        const r1 = n => n.toFixed(1);
 
-    <script>
-        const edges = {edges_json};
-        let currentHoveredNode = null;
+        function makeEdgePath(className) {
+            const path = document.createElementNS(SVG_NS, 'path');
+            path.setAttribute('fill', 'none');
+            path.setAttribute('class', className);
+            return path;
+        }
+
+        function addEdgeFor(nodeId, edge) {
+            const list = edgesByNode.get(nodeId);
+            if (list) {
+                list.push(edge);
+            } else {
+                edgesByNode.set(nodeId, [edge]);
+            }
+        }
+
+        function edgesOf(nodeId) {
+            return edgesByNode.get(nodeId) || [];
+        }
+
+        function drawEdges() {
+            edgesByNode = new Map();
 
-        function drawEdges() {{
             // Draw edges for each tree
-            document.querySelectorAll('.tree-layers').forEach(treeLayers => {{
+            document.querySelectorAll('.tree-layers').forEach(treeLayers => {
                 const svg = treeLayers.querySelector('svg.edges');
                 if (!svg) return;
 
@@ -698,180 +692,231 @@ def generate_html(trees: list[set[str]], graphemes: dict[str, dict], deps: dict[
                 svg.setAttribute('height', treeLayers.scrollHeight);
                 svg.innerHTML = '';
 
-                edges.forEach(([fromId, toId]) => {{
-                    const fromEl = document.getElementById(fromId);
-                    const toEl = document.getElementById(toId);
+                // Read every node's box once, relative to tree-layers, so the
+                // edge loop below never forces another layout
+                const coords = new Map();
+                treeLayers.querySelectorAll('.node').forEach(el => {
+                    const rect = el.getBoundingClientRect();
+                    coords.set(el.id, {
+                        cx: rect.left + rect.width / 2 - layersRect.left,
+                        top: rect.top - layersRect.top,
+                        bottom: rect.bottom - layersRect.top,
+                    });
+                });
+
+                // Every edge goes into one background path per tree; edges
+                // touching the hovered/selected node are redrawn on top
+                let bulkD = '';
+
+                edges.forEach(([fromIdx, toIdx]) => {
+                    const fromId = nodeIds[fromIdx];
+                    const toId = nodeIds[toIdx];
 
-                    if (!fromEl || !toEl) return;
                     // Only draw if both nodes are in this tree
-                    if (!treeLayers.contains(fromEl) || !treeLayers.contains(toEl)) return;
-
-                    const fromRect = fromEl.getBoundingClientRect();
-                    const toRect = toEl.getBoundingClientRect();
+                    const from = coords.get(fromId);
+                    const to = coords.get(toId);
+                    if (!from || !to) return;
 
-                    // Calculate center points relative to tree-layers
-                    const x1 = fromRect.left + fromRect.width / 2 - layersRect.left;
-                    const y1 = fromRect.bottom - layersRect.top;
-                    const x2 = toRect.left + toRect.width / 2 - layersRect.left;
-                    const y2 = toRect.top - layersRect.top;
+                    const x1 = from.cx;
+                    const y1 = from.bottom;
+                    const x2 = to.cx;
+                    const y2 = to.top;
 
-                    // Create curved path
+                    // Curved path segment (0.1px precision is plenty on screen)
                     const midY = (y1 + y2) / 2;
-                    const path = document.createElementNS('http://www.w3.org/2000/svg', 'path');
-                    path.setAttribute('d', `M ${{x1}} ${{y1}} C ${{x1}} ${{midY}}, ${{x2}} ${{midY}}, ${{x2}} ${{y2}}`);
-                    path.setAttribute('fill', 'none');
-                    path.dataset.from = fromId;
-                    path.dataset.to = toId;
-
-                    svg.appendChild(path);
-                }});
-            }});
+                    const d = `M ${r1(x1)} ${r1(y1)} C ${r1(x1)} ${r1(midY)}, ${r1(x2)} ${r1(midY)}, ${r1(x2)} ${r1(y2)} `;
+                    bulkD += d;
+                    const edge = {from: fromId, to: toId, d, svg};
+                    addEdgeFor(fromId, edge);
+                    addEdgeFor(toId, edge);
+                });
+
+                const bulk = makeEdgePath('bulk');
+                bulk.setAttribute('d', bulkD);
+                svg.appendChild(bulk);
+                svg.appendChild(makeEdgePath('highlighted'));
+            });
 
             // Re-apply highlighting if a node is currently hovered
-            if (currentHoveredNode) {{
+            if (currentHoveredNode) {
                 highlightNode(currentHoveredNode);
-            }}
-        }}
-
-        function highlightNode(nodeId) {{
-            document.querySelectorAll('path').forEach(path => {{
-                if (path.dataset.from === nodeId || path.dataset.to === nodeId) {{
-                    path.classList.add('highlighted');
-
-                    const otherId = path.dataset.from === nodeId ? path.dataset.to : path.dataset.from;
-                    const otherNode = document.getElementById(otherId);
-                    if (otherNode) otherNode.classList.add('highlighted');
-                }}
-            }});
-        }}
-
-        function clearHighlights() {{
-            document.querySelectorAll('path.highlighted').forEach(path => {{
-                path.classList.remove('highlighted');
-            }});
-            document.querySelectorAll('.node.highlighted').forEach(n => {{
+            } else {
+                updateEdgeHighlights();
+            }
+        }
+
+        // Redraw each tree's highlight path with the edges of the hovered and
+        // selected nodes
+        function updateEdgeHighlights() {
+            const active = new Set(edgesOf(currentHoveredNode));
+            edgesOf(selectedNode).forEach(edge => active.add(edge));
+
+            const highlightD = new Map();
+            active.forEach(edge => {
+                highlightD.set(edge.svg, (highlightD.get(edge.svg) || '') + edge.d);
+            });
+
+            document.querySelectorAll('svg.edges').forEach(svg => {
+                const overlay = svg.querySelector('path.highlighted');
+                if (overlay) overlay.setAttribute('d', highlightD.get(svg) || '');
+            });
+        }
+
+        function highlightNode(nodeId) {
+            edgesOf(nodeId).forEach(edge => {
+                const otherId = edge.from === nodeId ? edge.to : edge.from;
+                const otherNode = document.getElementById(otherId);
+                if (otherNode) otherNode.classList.add('highlighted');
+            });
+            updateEdgeHighlights();
+        }
+
+        function clearHighlights() {
+            document.querySelectorAll('.node.highlighted').forEach(n => {
                 n.classList.remove('highlighted');
-            }});
-
-            // Re-apply selection highlights if a node is selected
-            if (selectedNode) {{
-                document.querySelectorAll('path').forEach(path => {{
-                    if (path.dataset.from === selectedNode || path.dataset.to === selectedNode) {{
-                        path.classList.add('highlighted');
-                    }}
-                }});
-            }}
-        }}
+            });
 
-        let pendingClear = null;
-        let selectedNode = null;
+            // Leaves only the selection's edges highlighted, if any
+            updateEdgeHighlights();
+        }
 
-        function getConnectedNodes(nodeId) {{
+        function getConnectedNodes(nodeId) {
             const connected = new Set([nodeId]);
-            document.querySelectorAll('path').forEach(path => {{
-                if (path.dataset.from === nodeId) {{
-                    connected.add(path.dataset.to);
-                }} else if (path.dataset.to === nodeId) {{
-                    connected.add(path.dataset.from);
-                }}
-            }});
+            edgesOf(nodeId).forEach(edge => {
+                connected.add(edge.from === nodeId ? edge.to : edge.from);
+            });
             return connected;
-        }}
+        }
 
-        function selectNode(nodeId) {{
+        function selectNode(nodeId) {
             // Clear previous selection
             clearSelection();
 
             selectedNode = nodeId;
-            const connected = getConnectedNodes(nodeId);
-
-            // Mark selected node
-            const selectedEl = document.getElementById(nodeId);
-            if (selectedEl) selectedEl.classList.add('selected');
-
-            // Fade unconnected nodes and paths, highlight connected paths
-            document.querySelectorAll('.node').forEach(node => {{
-                if (!connected.has(node.id)) {{
-                    node.classList.add('faded');
-                }}
-            }});
-
-            document.querySelectorAll('path').forEach(path => {{
-                if (path.dataset.from === nodeId || path.dataset.to === nodeId) {{
-                    path.classList.add('highlighted');
-                }} else {{
-                    path.classList.add('faded');
-                }}
-            }});
-        }}
-
-        function clearSelection() {{
-            selectedNode = null;
-            document.querySelectorAll('.node.selected').forEach(n => n.classList.remove('selected'));
-            document.querySelectorAll('.node.faded').forEach(n => n.classList.remove('faded'));
-            document.querySelectorAll('path.faded').forEach(p => p.classList.remove('faded'));
-            document.querySelectorAll('path.highlighted').forEach(p => p.classList.remove('highlighted'));
-        }}
+
+            // Mark the selected node and its neighbours; the container class
+            // fades everything else through CSS
+            getConnectedNodes(nodeId).forEach(id => {
+                const el = document.getElementById(id);
+                if (el) el.classList.add(id === nodeId ? 'selected' : 'connected');
+            });
+            container.classList.add('has-selection');
+
+            // Highlight connected edges
+            updateEdgeHighlights();
+        }
+
+        function clearSelection() {
+            if (selectedNode !== null) {
+                getConnectedNodes(selectedNode).forEach(id => {
+                    const el = document.getElementById(id);
+                    if (el) el.classList.remove('selected', 'connected');
+                });
+                selectedNode = null;
+            }
+            container.classList.remove('has-selection');
+            updateEdgeHighlights();
+        }
 
         // Highlight connected nodes on hover
-        document.querySelectorAll('.node').forEach(node => {{
-            node.addEventListener('mouseenter', () => {{
+        function bindNodeEvents(node) {
+            node.addEventListener('mouseenter', () => {
                 // Cancel any pending clear
-                if (pendingClear) {{
+                if (pendingClear) {
                     clearTimeout(pendingClear);
                     pendingClear = null;
-                }}
+                }
 
                 // Only update if hovering a different node
-                if (currentHoveredNode !== node.id) {{
+                if (currentHoveredNode !== node.id) {
                     clearHighlights();
                     currentHoveredNode = node.id;
                     highlightNode(node.id);
-                }}
-            }});
+                }
+            });
 
-            node.addEventListener('mouseleave', (e) => {{
+            node.addEventListener('mouseleave', (e) => {
                 // Check if we're moving to another node or its children
                 const relatedTarget = e.relatedTarget;
-                if (relatedTarget && relatedTarget.closest && relatedTarget.closest('.node')) {{
+                if (relatedTarget && relatedTarget.closest && relatedTarget.closest('.node')) {
                     // Moving to another node - let that node's mouseenter handle it
                     return;
-                }}
+                }
 
                 // Debounce the clear to prevent flicker
-                pendingClear = setTimeout(() => {{
+                pendingClear = setTimeout(() => {
                     currentHoveredNode = null;
                     clearHighlights();
                     pendingClear = null;
-                }}, 50);
-            }});
+                }, 50);
+            });
 
             // Click to select/deselect
-            node.addEventListener('click', (e) => {{
+            node.addEventListener('click', (e) => {
                 e.stopPropagation();
-                if (selectedNode === node.id) {{
+                if (selectedNode === node.id) {
                     // Clicking same node deselects
                     clearSelection();
-                }} else {{
+                } else {
                     selectNode(node.id);
-                }}
-            }});
-        }});
+                }
+            });
+        }
+
+        document.querySelectorAll('.node').forEach(bindNodeEvents);
+
+        // Replace a <template> with its content the first time it is needed
+        function hydrate(templateId) {
+            const template = document.getElementById(templateId);
+            if (!template) return;
+            const content = template.content;
+            content.querySelectorAll('.node').forEach(bindNodeEvents);
+            template.replaceWith(content);
+        }
+
+        // Render the orphans once they come near the viewport
+        const orphansTemplate = document.getElementById('orphans-template');
+        if (orphansTemplate) {
+            const observer = new IntersectionObserver(entries => {
+                if (entries.some(entry => entry.isIntersecting)) {
+                    observer.disconnect();
+                    hydrate('orphans-template');
+                }
+            }, {rootMargin: '200px'});
+            observer.observe(orphansTemplate.parentElement);
+        }
 
         // Click outside nodes to clear selection
-        document.addEventListener('click', (e) => {{
-            if (!e.target.closest('.node')) {{
+        document.addEventListener('click', (e) => {
+            if (!e.target.closest('.node')) {
                 clearSelection();
-            }}
-        }});
+            }
+        });
+
+        // Coalesce bursts of redraw requests into one per animation frame.
+        // Edge coordinates are relative to their tree, so drawn paths stay
+        // valid across tab switches; a hidden composition tab has no layout
+        // to measure, so redraws requested then are deferred until it is
+        // shown again.
+        const compositionTab = document.getElementById('composition-tab');
+        let pendingDraw = null;
+        let edgesStale = false;
+        function scheduleDrawEdges() {
+            if (pendingDraw !== null) return;
+            pendingDraw = requestAnimationFrame(() => {
+                pendingDraw = null;
+                edgesStale = !compositionTab.classList.contains('active');
+                if (!edgesStale) drawEdges();
+            });
+        }
 
         // Draw edges on load and resize
-        window.addEventListener('load', drawEdges);
-        window.addEventListener('resize', drawEdges);
+        window.addEventListener('load', scheduleDrawEdges);
+        window.addEventListener('resize', scheduleDrawEdges, {passive: true});
 
         // Tab switching
-        document.querySelectorAll('.tab-btn').forEach(btn => {{
-            btn.addEventListener('click', () => {{
+        document.querySelectorAll('.tab-btn').forEach(btn => {
+            btn.addEventListener('click', () => {
                 const tabName = btn.dataset.tab;
 
                 // Update button states
@@ -879,24 +924,276 @@ def generate_html(trees: list[set[str]], graphemes: dict[str, dict], deps: dict[
                 btn.classList.add('active');
 
                 // Update content visibility
-                document.querySelectorAll('.tab-content').forEach(content => {{
+                document.querySelectorAll('.tab-content').forEach(content => {
                     content.classList.remove('active');
-                }});
+                });
                 document.getElementById(tabName + '-tab').classList.add('active');
 
-                // Redraw edges when switching to composition tab
-                if (tabName === 'composition') {{
-                    setTimeout(drawEdges, 50);
-                }}
-            }});
-        }});
-    </script>
+                // Render the popularity view on first visit; redraw edges
+                // on returning to the composition tab only if a redraw was
+                // deferred while it was hidden
+                if (tabName === 'popularity') {
+                    hydrate('popularity-template');
+                } else if (tabName === 'composition' && edgesStale) {
+                    scheduleDrawEdges();
+                }
+            });
+        });
+"""
+
+
+def generate_html(trees: list[set[str]], graphemes: dict[str, dict], deps: dict[str, list[str]], reverse_deps: dict[str, list[str]], orphans: set[str] = None, popularity_data: dict = None, by_depth: bool = False) -> str:
+    """Generate the complete HTML document as a string (see write_html)."""
+    out = io.StringIO()
+    write_html(out, trees, graphemes, deps, reverse_deps, orphans, popularity_data, by_depth)
+    return out.getvalue()
+
+
+def write_html(out: TextIO, trees: list[set[str]], graphemes: dict[str, dict], deps: dict[str, list[str]], reverse_deps: dict[str, list[str]], orphans: set[str] = None, popularity_data: dict = None, by_depth: bool = False) -> None:
+    """
+    Write the complete HTML document to out.
+
+    Each tree block is written as soon as it is built, so the whole page is
+    never held in memory as one string. With by_depth, tree layers come
+    from compute_depth_layers instead of stroke counts; orphans have no
+    edges and always stay grouped by stroke count. The orphans tree and the
+    popularity view are wrapped in <template> blocks that the page script
+    renders only when scrolled to or opened.
+    """
+
+    # Generate popularity view HTML
+    popularity_html = generate_popularity_view(graphemes, popularity_data)
+
+    # Local aliases for the per-node loops below
+    escape = html.escape
+    graphemes_get = graphemes.get
+    deps_get = deps.get
+    reverse_deps_get = reverse_deps.get
+
+    # HTML ids for every rendered node, shared by the edge list and the nodes
+    safe_ids = {gid: node_id_safe(gid) for tree_nodes in trees for gid in tree_nodes}
+    if orphans:
+        safe_ids.update((gid, node_id_safe(gid)) for gid in orphans)
+
+    # Layer (stroke count, or dependency depth) of every rendered node
+    stroke_of = {gid: get_stroke_count(gid, graphemes) for gid in safe_ids}
+    if by_depth:
+        tree_node_ids = (gid for tree_nodes in trees for gid in tree_nodes)
+        layer_of = compute_depth_layers(tree_node_ids, deps, reverse_deps)
+    else:
+        layer_of = stroke_of
+
+    # Collect all edges for JavaScript in one pass over deps, keeping only
+    # edges whose endpoints were placed in the same tree
+    node_to_tree = {gid: tree_idx for tree_idx, tree_nodes in enumerate(trees) for gid in tree_nodes}
+    # Edges are (from, to) indices into edge_node_ids rather than id strings,
+    # which keeps the embedded payload small
+    edge_node_ids: dict[str, int] = {}
+    all_edges = []
+    for parent_id, components in deps.items():
+        parent_tree = node_to_tree.get(parent_id)
+        if parent_tree is None:
+            continue
+        for component_id in components:
+            if node_to_tree.get(component_id) == parent_tree:
+                all_edges.append((
+                    edge_node_ids.setdefault(safe_ids[component_id], len(edge_node_ids)),
+                    edge_node_ids.setdefault(safe_ids[parent_id], len(edge_node_ids)),
+                ))
+
+    # Compact separators: the payload is embedded in the page, not read by people
+    node_ids_json = json.dumps(list(edge_node_ids), separators=(",", ":"))
+    edges_json = json.dumps(all_edges, separators=(",", ":"), check_circular=False)
+
+    out.write(f'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Grapheme Composition Graph</title>
+    <style>
+{_PAGE_CSS}    </style>
+</head>
+<body>
+    <h1>Grapheme Composition Graph</h1>
+
+    <div class="tab-buttons">
+        <button class="tab-btn active" data-tab="composition">Composition Trees</button>
+        <button class="tab-btn" data-tab="popularity">Popularity View</button>
+    </div>
+
+    <div id="composition-tab" class="tab-content active">
+        <div class="container" id="container">
+            ''')
+
+    # Write tree HTML
+    for tree_idx, tree_nodes in enumerate(trees):
+        by_strokes = group_by_stroke(tree_nodes, layer_of)
+        stroke_counts = list(by_strokes)
+
+        # Compute layer ordering (by child count within each category),
+        # then reorder within categories to cut down edge crossings
+        ordered_layers = compute_layer_ordering(
+            by_strokes, stroke_counts, deps, reverse_deps, graphemes
+        )
+        ordered_layers = sweep_layer_ordering(ordered_layers, stroke_counts, deps, reverse_deps)
+
+        # Find max total nodes in any layer (determines overall width)
+        max_total_nodes = max(
+            len(ordered_layers[s][0]) + len(ordered_layers[s][1]) + len(ordered_layers[s][2])
+            for s in stroke_counts
+        )
+        # 70px per node slot + padding on edges
+        total_layer_width = max(max_total_nodes * 70, 400)
+
+        layers_html = []
+        for strokes in stroke_counts:
+            primitives, composites, finals = ordered_layers[strokes]
+            all_nodes = primitives + composites + finals
+            total_nodes = len(all_nodes)
+
+            if strokes == 999:
+                stroke_label = "Unknown"
+            elif by_depth:
+                stroke_label = f"Depth {strokes}"
+            else:
+                stroke_label = f"{strokes} stroke{'s' if strokes != 1 else ''}"
+            bg_color = stroke_color(strokes)
+
+            # Build all nodes with positions across the full layer
+            nodes_html = []
+            for i, gid in enumerate(all_nodes):
+                g = graphemes_get(gid, {})
+                symbol = escape(g.get("symbol", "?"))
+                name = escape(g.get("name", "?"))
+                safe_id = safe_ids[gid]
+
+                # Calculate position as percentage across full layer
+                if total_nodes > 1:
+                    left_pct = (i / (total_nodes - 1)) * 100
+                else:
+                    left_pct = 50
+
+                # Count parents (components this grapheme uses) and children (graphemes that use this)
+                parent_count = len(deps_get(gid, ()))
+                child_count = len(reverse_deps_get(gid, ()))
+
+                parent_badge = f'<span class="badge parent-count">{parent_count}</span>' if parent_count > 0 else ''
+                child_badge = f'<span class="badge child-count">{child_count}</span>' if child_count > 0 else ''
+
+                nodes_html.append(
+                    f'<div class="node" id="{safe_id}" style="left: {left_pct:.1f}%;" title="{symbol} - {name}">'
+                    f'{parent_badge}<span class="symbol">{symbol}</span><span class="name">{name}</span>{child_badge}</div>'
+                )
+
+            layers_html.append(f'''
+                <div class="layer" style="background-color: {bg_color};">
+                    <div class="layer-label">{stroke_label}</div>
+                    <div class="layer-content" style="width: {total_layer_width}px;">
+                        <div class="nodes-container">
+                            {''.join(nodes_html)}
+                        </div>
+                    </div>
+                </div>
+            ''')
+
+        out.write(f'''
+            <div class="tree">
+                <div class="tree-header">Tree {tree_idx + 1} ({len(tree_nodes)} graphemes)</div>
+                <div class="tree-content">
+                    <div class="tree-layers" data-tree="{tree_idx}">
+                        <svg class="edges" data-tree="{tree_idx}"></svg>
+                        {''.join(layers_html)}
+                    </div>
+                </div>
+            </div>
+        ''')
+
+    # Add orphans tree if there are any
+    if orphans:
+        by_strokes = group_by_stroke(orphans, stroke_of)
+        stroke_counts = list(by_strokes)
+
+        # Find max nodes in any layer
+        max_total_nodes = max(len(by_strokes[s]) for s in stroke_counts)
+        total_layer_width = max(max_total_nodes * 70, 400)
+
+        layers_html = []
+        for strokes in stroke_counts:
+            layer_nodes = sorted(by_strokes[strokes], key=lambda x: graphemes_get(x, {}).get("symbol", ""))
+            total_nodes = len(layer_nodes)
+
+            stroke_label = f"{strokes} stroke{'s' if strokes != 1 else ''}" if strokes != 999 else "Unknown"
+            bg_color = stroke_color(strokes)
+
+            nodes_html = []
+            for i, gid in enumerate(layer_nodes):
+                g = graphemes_get(gid, {})
+                symbol = escape(g.get("symbol", "?"))
+                name = escape(g.get("name", "?"))
+                safe_id = safe_ids[gid]
+
+                if total_nodes > 1:
+                    left_pct = (i / (total_nodes - 1)) * 100
+                else:
+                    left_pct = 50
+
+                nodes_html.append(
+                    f'<div class="node" id="{safe_id}" style="left: {left_pct:.1f}%;" title="{symbol} - {name}">'
+                    f'<span class="symbol">{symbol}</span><span class="name">{name}</span></div>'
+                )
+
+            layers_html.append(f'''
+                <div class="layer" style="background-color: {bg_color};">
+                    <div class="layer-label">{stroke_label}</div>
+                    <div class="layer-content" style="width: {total_layer_width}px;">
+                        <div class="nodes-container">
+                            {''.join(nodes_html)}
+                        </div>
+                    </div>
+                </div>
+            ''')
+
+        # Orphans sit below every tree, so their nodes stay in a template
+        # until the block scrolls into view
+        out.write(f'''
+            <div class="tree orphans-tree">
+                <div class="tree-header">Orphans ({len(orphans)} graphemes with no relationships)</div>
+                <template id="orphans-template">
+                <div class="tree-content">
+                    <div class="tree-layers" data-tree="orphans">
+                        {''.join(layers_html)}
+                    </div>
+                </div>
+                </template>
+            </div>
+        ''')
+
+    out.write(f'''
+        </div>
+    </div>
+
+    <div id="popularity-tab" class="tab-content">
+        <template id="popularity-template">
+        {popularity_html}
+        </template>
+    </div>
+
+    <script>
+        const nodeIds = {node_ids_json};
+        const edges = {edges_json};
+{_PAGE_SCRIPT}    </script>
 </body>
 </html>
-'''
+''')
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Create the grapheme composition graph")
+    parser.add_argument("--by-depth", action="store_true", help="Layer trees by dependency depth instead of stroke count")
+    parser.add_argument("--gz", action="store_true", help="Write the page gzip-compressed (fast level 1) to a .gz file")
+    args = parser.parse_args()
+
     print("Loading graphemes...")
     graphemes = load_graphemes()
     print(f"  Loaded {len(graphemes)} graphemes")
@@ -912,11 +1209,13 @@ def main():
     else:
         print("  No popularity data found (run analyze_component_popularity.py first)")
 
-    # Find all involved graphemes
-    all_components = set()
+    # Find all involved graphemes (parents and their components), counting
+    # edges in the same pass for the summary
+    all_involved = set(deps)
+    total_edges = 0
     for components in deps.values():
-        all_components.update(components)
-    all_involved = set(deps.keys()) | all_components
+        all_involved.update(components)
+        total_edges += len(components)
 
     # Find connected components (separate trees)
     trees = find_connected_components(all_involved, deps, reverse_deps)
@@ -927,26 +1226,25 @@ def main():
         print(f"  ... and {len(trees) - 5} more trees")
 
     # Find orphans (graphemes with no relationships)
-    all_grapheme_ids = set(graphemes.keys())
-    orphans = all_grapheme_ids - all_involved
+    orphans = graphemes.keys() - all_involved
     print(f"  Orphans: {len(orphans)} graphemes")
 
-    # Generate HTML
-    html_content = generate_html(trees, graphemes, deps, reverse_deps, orphans, popularity_data)
-
-    # Write output
+    # Generate HTML straight into the output file
     REPORTS_DIR.mkdir(parents=True, exist_ok=True)
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    if args.gz:
+        output_file = OUTPUT_FILE.with_name(OUTPUT_FILE.name + ".gz")
+        out = gzip.open(output_file, "wt", encoding="utf-8", compresslevel=1)
+    else:
+        output_file = OUTPUT_FILE
+        out = open(output_file, "w", encoding="utf-8", buffering=1 << 20)
+    with out as f:
+        write_html(f, trees, graphemes, deps, reverse_deps, orphans, popularity_data, args.by_depth)
 
-    print(f"\nGraph written to: {OUTPUT_FILE}")
+    print(f"\nGraph written to: {output_file}")
     print(f"\nSummary:")
     print(f"  Total nodes: {len(all_involved)}")
-    print(f"  Total edges: {sum(len(c) for c in deps.values())}")
+    print(f"  Total edges: {total_edges}")
     print(f"  Separate trees: {len(trees)}")
-
-    all_grapheme_ids = set(graphemes.keys())
-    orphans = all_grapheme_ids - all_involved
     print(f"  Orphan graphemes (not shown): {len(orphans)}")
 
 
@@ -2,8 +2,11 @@
 """
 Dump all grapheme documents to a text file for review.
 Sorted by stroke count first, then Unicode codepoint.
+With --gz the dump is written gzip-compressed to graphemes_all.txt.gz.
 """
 
+import argparse
+import gzip
 import sys
 from pathlib import Path
 
@@ -14,7 +17,16 @@ from lib.paths import REPORTS_DIR
 from lib.grapheme_io import load_graphemes_sorted
 
 
+def format_variant(symbol: str, unicode_id: str) -> str:
+    """Format one variant as 'symbol (U+XXXX)', or just the symbol if it has no id."""
+    return f"{symbol} ({unicode_id})" if unicode_id else symbol
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Dump all grapheme documents to a text file")
+    parser.add_argument("--gz", action="store_true", help="Write the dump gzip-compressed (fast level 1) to a .gz file")
+    args = parser.parse_args()
+
     output_file = REPORTS_DIR / 'graphemes_all.txt'
 
     # Load all documents, sorted by (strokeCount, unicode)
@@ -23,33 +35,34 @@ def main():
     # Ensure output directory exists
     REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Write to file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(f"Japanese Grapheme Dataset — {len(docs)} entries (sorted by stroke count)\n")
-        f.write("=" * 60 + "\n\n")
+    # Write to file through a large buffer (or gzip); each record is one
+    # write call
+    if args.gz:
+        output_file = output_file.with_name(output_file.name + '.gz')
+        out = gzip.open(output_file, 'wt', encoding='utf-8', compresslevel=1)
+    else:
+        out = open(output_file, 'w', encoding='utf-8', buffering=1 << 20)
+    with out as f:
+        write = f.write
+        write(f"Japanese Grapheme Dataset — {len(docs)} entries (sorted by stroke count)\n")
+        write("=" * 60 + "\n\n")
 
         for doc in docs:
             unicode_id = doc.get('unicode', doc['$id'].replace('grapheme:', ''))
             symbol = doc.get('symbol', '?')
             name = doc.get('name', '')
             strokes = doc.get('strokeCount', '')
-            variants = doc.get('variants', [])
-
-            f.write(f"{unicode_id}  {symbol}  {name}\n")
-            f.write(f"  strokes: {strokes}\n")
+            variants = doc.get('variants')
 
+            variant_line = ''
             if variants:
-                variant_strs = []
-                for v in variants:
-                    v_symbol = v.get('symbol', '?')
-                    v_unicode = v.get('unicode', v.get('$id', ''))
-                    if v_unicode:
-                        variant_strs.append(f"{v_symbol} ({v_unicode})")
-                    else:
-                        variant_strs.append(v_symbol)
-                f.write(f"  variants: {', '.join(variant_strs)}\n")
-
-            f.write("\n")
+                variant_strs = [
+                    format_variant(v.get('symbol', '?'), v.get('unicode', v.get('$id', '')))
+                    for v in variants
+                ]
+                variant_line = f"  variants: {', '.join(variant_strs)}\n"
+
+            write(f"{unicode_id}  {symbol}  {name}\n  strokes: {strokes}\n{variant_line}\n")
 
     print(f"Written {len(docs)} graphemes to {output_file}")
 
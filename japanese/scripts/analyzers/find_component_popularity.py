@@ -15,14 +15,23 @@ Usage:
 """
 
 import argparse
+import heapq
 import json
 import os
 import sys
-from collections import defaultdict
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from itertools import groupby
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Iterable, Optional
+
+# Optional fast JSON serializer (falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Lazy imports for optional database functionality
 libsql = None
@@ -49,7 +58,7 @@ def _ensure_db_imports():
 # Add parent directory to path for lib imports
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from lib.paths import REPORTS_DIR, TURSO_ENV_FILE
+from lib.paths import REPORTS_DIR, TURSO_ENV_FILE, TURSO_REPLICA_PATH
 
 OUTPUT_TXT = REPORTS_DIR / "component-popularity.txt"
 OUTPUT_JSON = REPORTS_DIR / "component-popularity.json"
@@ -61,13 +70,14 @@ OUTPUT_GRAPHEME_POP = REPORTS_DIR / "grapheme-popularity.txt"
 # ---------------------------------------------------------------------------
 
 from adapters.component_analysis import (
-    load_chise_ids,
+    load_chise_components,
     load_kanjivg_index,
+    load_kanjivg_components,
     get_chise_components,
     get_kanjivg_components,
-    get_library_status,
-    get_components,
     get_all_components_expanded,
+    make_components_expander,
+    resolve,
 )
 
 from adapters.kanjidic import parse_kanjidic
@@ -79,7 +89,7 @@ from lib.normalizers import make_grapheme_normalizer
 # Data Classes
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class KanjiEntry:
     """Represents a kanji with its analysis data."""
     original: str                     # Original kanji character from kanjidic2
@@ -98,7 +108,12 @@ class KanjiEntry:
 # ---------------------------------------------------------------------------
 
 def connect_db():
-    """Load .env and connect to Turso."""
+    """
+    Load .env and connect to Turso through a local embedded replica.
+
+    The replica is synced once here; queries then run against the local
+    file instead of making a network round trip each.
+    """
     _ensure_db_imports()
     load_dotenv(TURSO_ENV_FILE)
     url = os.environ.get("TURSO_DATABASE_URL")
@@ -106,7 +121,8 @@ def connect_db():
     if not url or not token:
         print(f"Error: TURSO_DATABASE_URL and TURSO_AUTH_TOKEN must be set in {TURSO_ENV_FILE}")
         sys.exit(1)
-    conn = libsql.connect(database=url, auth_token=token)
+    conn = libsql.connect(database=str(TURSO_REPLICA_PATH), sync_url=url, auth_token=token)
+    conn.sync()
     return conn
 
 
@@ -122,8 +138,8 @@ def load_graphemes_from_turso(conn) -> tuple[dict[str, str], dict[str, str], dic
         - grapheme_id_to_doc: maps grapheme_id -> document with variants
     """
     grapheme_primaries: dict[str, str] = {}
-    grapheme_id_to_symbol: dict[str, str] = {}
     variant_to_canonical: dict[str, str] = {}
+    variant_to_symbol: dict[str, str] = {}
     grapheme_id_to_doc: dict[str, dict] = {}
 
     # Load primary graphemes
@@ -132,26 +148,29 @@ def load_graphemes_from_turso(conn) -> tuple[dict[str, str], dict[str, str], dic
         grapheme_id, symbol = row[0], row[1]
         if symbol:
             grapheme_primaries[symbol] = grapheme_id
-            grapheme_id_to_symbol[grapheme_id] = symbol
             grapheme_id_to_doc[grapheme_id] = {"symbol": symbol, "variants": []}
 
-    # Load variants
-    rows = conn.execute("SELECT grapheme_id, symbol FROM ja_data_grapheme_variant").fetchall()
+    # Load variants joined with their canonical symbol (variant symbol ->
+    # canonical symbol is the mapping used for normalization). LEFT JOIN so
+    # variants of graphemes without a symbol still map to their grapheme.
+    rows = conn.execute(
+        "SELECT v.grapheme_id, v.symbol, g.symbol"
+        " FROM ja_data_grapheme_variant v"
+        " LEFT JOIN ja_data_grapheme g ON g.id = v.grapheme_id"
+    ).fetchall()
     for row in rows:
-        grapheme_id, symbol = row[0], row[1]
+        grapheme_id, symbol, canonical_sym = row[0], row[1], row[2]
         if symbol:
             variant_to_canonical[symbol] = grapheme_id
+            # The last row for a symbol wins, as in variant_to_canonical
+            if canonical_sym:
+                variant_to_symbol[symbol] = canonical_sym
+            else:
+                variant_to_symbol.pop(symbol, None)
             # Add variant to the grapheme's document
             if grapheme_id in grapheme_id_to_doc:
                 grapheme_id_to_doc[grapheme_id]["variants"].append({"symbol": symbol})
 
-    # Build variant symbol -> canonical symbol mapping
-    variant_to_symbol: dict[str, str] = {}
-    for variant_sym, grapheme_id in variant_to_canonical.items():
-        canonical_sym = grapheme_id_to_symbol.get(grapheme_id)
-        if canonical_sym:
-            variant_to_symbol[variant_sym] = canonical_sym
-
     return grapheme_primaries, variant_to_canonical, variant_to_symbol, grapheme_id_to_doc
 
 
@@ -165,8 +184,8 @@ def build_memoization_dict(
     kanjidic_entries: list[tuple[str, int]],
     grapheme_primaries: dict[str, str],
     variant_to_canonical: dict[str, str],
-    chise_ids: dict[str, str],
-    kanjivg_chars: set[str],
+    chise_components: dict[str, frozenset[str]],
+    kanjivg_components: dict[str, frozenset[str]],
     normalizer: Callable[[str], str],
 ) -> dict[str, KanjiEntry]:
     """
@@ -186,12 +205,14 @@ def build_memoization_dict(
         normalized = normalizer(kanji)
 
         # Check if already exists (collision)
-        if normalized in kanji_dict:
-            existing = kanji_dict[normalized]
-            # Keep lower stroke count (represents simpler form)
-            if stroke_count < existing.stroke_count:
-                existing.original = kanji
-                existing.stroke_count = stroke_count
+        entry = kanji_dict.get(normalized)
+        if entry is not None:
+            # Keep lower stroke count (represents simpler form); a duplicate
+            # that is not kept must not overwrite the kept kanji's flags
+            if stroke_count >= entry.stroke_count:
+                continue
+            entry.original = kanji
+            entry.stroke_count = stroke_count
         else:
             # Create new entry
             entry = KanjiEntry(
@@ -201,9 +222,7 @@ def build_memoization_dict(
             )
             kanji_dict[normalized] = entry
 
-        # Set flags (update every iteration to ensure correctness)
-        entry = kanji_dict[normalized]
-
+        # Set flags for the kept kanji
         # Check if in grapheme database
         if normalized in grapheme_primaries:
             entry.is_grapheme = True
@@ -212,14 +231,12 @@ def build_memoization_dict(
             entry.is_grapheme = True
             entry.grapheme_id = variant_to_canonical[normalized]
 
-        # Get status in both libraries
-        chise_status, kanjivg_status = get_library_status(kanji, chise_ids, kanjivg_chars, normalizer)
-        entry.chise_status = chise_status
-        entry.kanjivg_status = kanjivg_status
-
-        # Determine decomposition source (which library was used)
-        components, source = get_components(kanji, chise_ids, kanjivg_chars, normalizer)
-        entry.decomp_source = source
+        # Get status in both libraries and the decomposition source (which
+        # library was used) from a single lookup
+        result = resolve(kanji, chise_components, kanjivg_components, normalizer)
+        entry.chise_status = result.chise_status
+        entry.kanjivg_status = result.kanjivg_status
+        entry.decomp_source = result.primary_source
 
         # Initialize popularity to 0 for ALL entries
         # Even primitives with no decomposition can be components of other kanji
@@ -237,8 +254,8 @@ def calculate_popularity(
     grapheme_primaries: dict[str, str],
     variant_to_canonical: dict[str, str],
     grapheme_id_to_doc: dict[str, dict],
-    chise_ids: dict[str, str],
-    kanjivg_chars: set[str],
+    chise_components: dict[str, frozenset[str]],
+    kanjivg_components: dict[str, frozenset[str]],
     normalizer: Callable[[str], str],
 ) -> None:
     """
@@ -251,47 +268,85 @@ def calculate_popularity(
     Mutates kanji_dict in place.
     """
 
-    def get_expanded_children(char: str) -> set[str]:
+    # Children depend only on the character, but the same character is
+    # reached through many parents, so expansions are cached per run
+    children_cache: dict[str, tuple[tuple[str, KanjiEntry], ...]] = {}
+    get_variant_children = make_components_expander(chise_components, kanjivg_components, normalizer)
+
+    # Primary or variant symbol -> grapheme id (primary symbols win)
+    symbol_to_gid = {**variant_to_canonical, **grapheme_primaries}
+
+    # A kanji whose decomposition source is atomic or none has no components
+    # in either library (original or normalized), so expanding it yields no
+    # children; such characters are counted but never pushed or expanded
+    leaf_chars = {
+        entry.original for entry in kanji_dict.values()
+        if entry.decomp_source not in ("chise", "kanjivg")
+    }
+
+    def get_expanded_children(char: str) -> tuple[tuple[str, KanjiEntry], ...]:
         """
-        Get ALL children using expanded search.
+        Get ALL children using expanded search, as (child, entry) pairs.
         If a child is a grapheme with variants, also get children of those variants.
+
+        Each child is normalized and looked up in kanji_dict once here;
+        children without an entry are dropped, so visits only touch entries.
         """
-        # Get all components from all sources (CHISE + KanjiVG, original + normalized)
-        giant_set = get_all_components_expanded(char, chise_ids, kanjivg_chars, normalizer)
+        cached = children_cache.get(char)
+        if cached is not None:
+            return cached
+
+        # Get all components from all sources (CHISE + KanjiVG, original + normalized).
+        # The returned set is freshly built for this call, so it is extended in place
+        expanded_set = get_all_components_expanded(char, chise_components, kanjivg_components, normalizer)
 
         # For each component that is a grapheme, also get children of its variants
-        expanded_set = set(giant_set)
-        for comp in giant_set:
+        # (merged after the loop, since expanded_set is being iterated)
+        normalized_of: dict[str, str] = {}
+        variant_children: list[frozenset[str]] = []
+        for comp in expanded_set:
             normalized_comp = normalizer(comp)
-            comp_gid = grapheme_primaries.get(normalized_comp) or variant_to_canonical.get(normalized_comp)
+            normalized_of[comp] = normalized_comp
+            comp_gid = symbol_to_gid.get(normalized_comp)
             if comp_gid and comp_gid in grapheme_id_to_doc:
                 comp_doc = grapheme_id_to_doc[comp_gid]
                 for variant in comp_doc.get("variants", []):
                     variant_symbol = variant.get("symbol")
                     if variant_symbol:
-                        variant_children = get_all_components_expanded(variant_symbol, chise_ids, kanjivg_chars, normalizer)
-                        expanded_set.update(variant_children)
+                        variant_children.append(get_variant_children(variant_symbol))
+        expanded_set.update(*variant_children)
+
+        pairs = []
+        for child in expanded_set:
+            child_normalized = normalized_of[child] if child in normalized_of else normalizer(child)
+            entry = kanji_dict.get(child_normalized)
+            if entry:
+                pairs.append((child, entry))
 
-        return expanded_set
+        children = tuple(pairs)
+        children_cache[char] = children
+        return children
 
     def process_children(char: str) -> None:
         """
         Process a character's children.
-        For each child: increment popularity, recurse only if first time (popularity was 0).
-        """
-        children = get_expanded_children(char)
+        For each child: increment popularity, descend only if first time (popularity was 0).
 
-        for child in children:
-            child_normalized = normalizer(child)
-            entry = kanji_dict.get(child_normalized)
-
-            if entry:
+        Uses an explicit stack instead of recursion, so deep decomposition
+        chains cannot hit the recursion limit. The "first time" check is
+        shared across all roots, and the child string that first reaches an
+        entry is the one expanded (e.g. ⻌ rather than 辶), so this walk is
+        kept serial in kanji_dict order.
+        """
+        stack = [char]
+        while stack:
+            for child, entry in get_expanded_children(stack.pop()):
                 was_zero = entry.popularity == 0
                 entry.popularity += 1
 
-                # Only recurse if this is the first time seeing this child
-                if was_zero:
-                    process_children(child)
+                # Only descend if this is the first time seeing this child
+                if was_zero and child not in leaf_chars:
+                    stack.append(child)
 
     # Process each kanji entry
     print("  Processing kanji entries...")
@@ -299,7 +354,8 @@ def calculate_popularity(
     processed = 0
 
     for entry in kanji_dict.values():
-        process_children(entry.original)
+        if entry.original not in leaf_chars:
+            process_children(entry.original)
 
         processed += 1
         if processed % 1000 == 0:
@@ -310,70 +366,117 @@ def calculate_popularity(
 # Output Functions
 # ---------------------------------------------------------------------------
 
+# The "src:" column of report lines: decomposition source padded to 13
+# characters, then the status in the library that was NOT the source, e.g.
+# "chise         (kvg: atomic)". There are only 45 combinations, so they are
+# formatted once here and each line does a single lookup.
+_LIBRARY_STATUSES = ("decomposed", "atomic", "none")
+_SOURCE_COLUMN: dict[tuple[str, str, str], str] = {
+    (source, chise_status, kanjivg_status): f"{source:<13} " + (
+        f"(kvg: {kanjivg_status})" if source.startswith("chise")
+        else f"(chise: {chise_status})" if source.startswith("kanjivg")
+        else ""
+    )
+    for source in ("chise", "chise-atomic", "kanjivg", "kanjivg-atomic", "none")
+    for chise_status in _LIBRARY_STATUSES
+    for kanjivg_status in _LIBRARY_STATUSES
+}
+
+
+def source_column(entry: KanjiEntry) -> str:
+    """Get the padded decomposition source and other-library status of an entry."""
+    return _SOURCE_COLUMN[entry.decomp_source, entry.chise_status, entry.kanjivg_status]
+
+
+def count_stats(entries: Iterable[KanjiEntry]) -> Counter:
+    """
+    Count entries by library status, decomposition source and grapheme flag in one pass.
+
+    Keys are ("chise", chise_status), ("kvg", kanjivg_status),
+    ("src", decomp_source) and ("grapheme", is_grapheme); missing keys count 0.
+    """
+    stats: Counter = Counter()
+    for e in entries:
+        stats["chise", e.chise_status] += 1
+        stats["kvg", e.kanjivg_status] += 1
+        stats["src", e.decomp_source] += 1
+        stats["grapheme", e.is_grapheme] += 1
+    return stats
+
+
+def group_by_stroke(entries: Iterable[KanjiEntry]) -> dict[int, list[KanjiEntry]]:
+    """
+    Group entries by stroke count (ascending), each group by popularity descending.
+
+    One sort on (stroke_count, -popularity) does both; it is stable, so ties
+    keep their input order.
+    """
+    ordered = sorted(entries, key=lambda e: (e.stroke_count, -e.popularity))
+    return {strokes: list(group) for strokes, group in groupby(ordered, key=attrgetter("stroke_count"))}
+
+
 def write_text_report(
     kanji_dict: dict[str, KanjiEntry],
     output_path: Path,
+    stats: Optional[Counter] = None,
 ) -> None:
     """
     Write a text report sorted by stroke count, then by popularity descending.
-    """
-    # Group by stroke count
-    by_strokes: dict[int, list[KanjiEntry]] = defaultdict(list)
-    for entry in kanji_dict.values():
-        by_strokes[entry.stroke_count].append(entry)
 
-    # Sort each group by popularity descending
-    for stroke_count in by_strokes:
-        by_strokes[stroke_count].sort(key=lambda e: e.popularity, reverse=True)
+    stats is count_stats(kanji_dict.values()), computed here if not given.
+    """
+    # Group by stroke count, each group sorted by popularity descending
+    by_strokes = group_by_stroke(kanji_dict.values())
 
     # Calculate stats
+    if stats is None:
+        stats = count_stats(kanji_dict.values())
     total = len(kanji_dict)
-    chise_decomp = sum(1 for e in kanji_dict.values() if e.chise_status == "decomposed")
-    chise_atomic = sum(1 for e in kanji_dict.values() if e.chise_status == "atomic")
-    kvg_decomp = sum(1 for e in kanji_dict.values() if e.kanjivg_status == "decomposed")
-    kvg_atomic = sum(1 for e in kanji_dict.values() if e.kanjivg_status == "atomic")
-    from_chise = sum(1 for e in kanji_dict.values() if e.decomp_source == "chise")
-    from_chise_atomic = sum(1 for e in kanji_dict.values() if e.decomp_source == "chise-atomic")
-    from_kanjivg = sum(1 for e in kanji_dict.values() if e.decomp_source == "kanjivg")
-    from_kanjivg_atomic = sum(1 for e in kanji_dict.values() if e.decomp_source == "kanjivg-atomic")
-    no_decomp = sum(1 for e in kanji_dict.values() if e.decomp_source == "none")
-    graphemes = sum(1 for e in kanji_dict.values() if e.is_grapheme)
+    chise_decomp = stats["chise", "decomposed"]
+    chise_atomic = stats["chise", "atomic"]
+    kvg_decomp = stats["kvg", "decomposed"]
+    kvg_atomic = stats["kvg", "atomic"]
+    from_chise = stats["src", "chise"]
+    from_chise_atomic = stats["src", "chise-atomic"]
+    from_kanjivg = stats["src", "kanjivg"]
+    from_kanjivg_atomic = stats["src", "kanjivg-atomic"]
+    no_decomp = stats["src", "none"]
+    graphemes = stats["grapheme", True]
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Collect the report and write it with a single call
+    parts: list[str] = []
+    add = parts.append
+    entry_line = "{}  pop: {:>5}  grapheme: {}  src: {}\n".format
+    add("Kanji Component Popularity Analysis\n")
+    add("=" * 40 + "\n")
+    add(f"Generated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}\n")
+    add(f"Total kanji in kanjidic2: {total}\n")
+    add(f"\nLibrary Coverage:\n")
+    add(f"  CHISE:   {chise_decomp + chise_atomic} total ({chise_decomp} decomposed, {chise_atomic} atomic)\n")
+    add(f"  KanjiVG: {kvg_decomp + kvg_atomic} total ({kvg_decomp} decomposed, {kvg_atomic} atomic)\n")
+    add(f"\nDecomposition Sources Used:\n")
+    add(f"  chise:         {from_chise:>5} ({100*from_chise/total:.1f}%)\n")
+    add(f"  chise-atomic:  {from_chise_atomic:>5} ({100*from_chise_atomic/total:.1f}%)\n")
+    add(f"  kanjivg:       {from_kanjivg:>5} ({100*from_kanjivg/total:.1f}%)\n")
+    add(f"  kanjivg-atomic:{from_kanjivg_atomic:>5} ({100*from_kanjivg_atomic/total:.1f}%)\n")
+    add(f"  none:          {no_decomp:>5} ({100*no_decomp/total:.1f}%)\n")
+    add(f"\nGraphemes defined: {graphemes}\n")
+    add("\n")
+
+    for stroke_count in by_strokes:
+        entries = by_strokes[stroke_count]
+        add(f"=== {stroke_count} Stroke{'s' if stroke_count != 1 else ''} ({len(entries)} entries) ===\n")
+
+        for entry in entries:
+            grapheme_flag = "YES" if entry.is_grapheme else "NO"
+            add(entry_line(entry.normalized, entry.popularity, grapheme_flag, source_column(entry)))
+
+        add("\n")
+
     with open(output_path, "w", encoding="utf-8") as f:
-        f.write("Kanji Component Popularity Analysis\n")
-        f.write("=" * 40 + "\n")
-        f.write(f"Generated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}\n")
-        f.write(f"Total kanji in kanjidic2: {total}\n")
-        f.write(f"\nLibrary Coverage:\n")
-        f.write(f"  CHISE:   {chise_decomp + chise_atomic} total ({chise_decomp} decomposed, {chise_atomic} atomic)\n")
-        f.write(f"  KanjiVG: {kvg_decomp + kvg_atomic} total ({kvg_decomp} decomposed, {kvg_atomic} atomic)\n")
-        f.write(f"\nDecomposition Sources Used:\n")
-        f.write(f"  chise:         {from_chise:>5} ({100*from_chise/total:.1f}%)\n")
-        f.write(f"  chise-atomic:  {from_chise_atomic:>5} ({100*from_chise_atomic/total:.1f}%)\n")
-        f.write(f"  kanjivg:       {from_kanjivg:>5} ({100*from_kanjivg/total:.1f}%)\n")
-        f.write(f"  kanjivg-atomic:{from_kanjivg_atomic:>5} ({100*from_kanjivg_atomic/total:.1f}%)\n")
-        f.write(f"  none:          {no_decomp:>5} ({100*no_decomp/total:.1f}%)\n")
-        f.write(f"\nGraphemes defined: {graphemes}\n")
-        f.write("\n")
-
-        for stroke_count in sorted(by_strokes.keys()):
-            entries = by_strokes[stroke_count]
-            f.write(f"=== {stroke_count} Stroke{'s' if stroke_count != 1 else ''} ({len(entries)} entries) ===\n")
-
-            for entry in entries:
-                grapheme_flag = "YES" if entry.is_grapheme else "NO"
-                # Show "other" library status in parentheses
-                if entry.decomp_source.startswith("chise"):
-                    other_status = f"(kvg: {entry.kanjivg_status})"
-                elif entry.decomp_source.startswith("kanjivg"):
-                    other_status = f"(chise: {entry.chise_status})"
-                else:
-                    other_status = ""
-                f.write(f"{entry.normalized}  pop: {entry.popularity:>5}  grapheme: {grapheme_flag}  src: {entry.decomp_source:<13} {other_status}\n")
-
-            f.write("\n")
+        f.write("".join(parts))
 
     print(f"  Written to: {output_path}")
 
@@ -400,62 +503,55 @@ def write_candidates_report(
         print("  No candidates found")
         return
 
-    # Group by stroke count
-    by_strokes: dict[int, list[KanjiEntry]] = defaultdict(list)
-    for entry in candidates:
-        by_strokes[entry.stroke_count].append(entry)
-
-    # Sort each group by popularity descending
-    for stroke_count in by_strokes:
-        by_strokes[stroke_count].sort(key=lambda e: e.popularity, reverse=True)
+    # Group by stroke count, each group sorted by popularity descending
+    by_strokes = group_by_stroke(candidates)
 
     # Calculate stats for candidates
+    stats = count_stats(candidates)
     total_candidates = len(candidates)
-    chise_decomp = sum(1 for e in candidates if e.chise_status == "decomposed")
-    chise_atomic = sum(1 for e in candidates if e.chise_status == "atomic")
-    kvg_decomp = sum(1 for e in candidates if e.kanjivg_status == "decomposed")
-    kvg_atomic = sum(1 for e in candidates if e.kanjivg_status == "atomic")
-    from_chise = sum(1 for e in candidates if e.decomp_source == "chise")
-    from_chise_atomic = sum(1 for e in candidates if e.decomp_source == "chise-atomic")
-    from_kanjivg = sum(1 for e in candidates if e.decomp_source == "kanjivg")
-    from_kanjivg_atomic = sum(1 for e in candidates if e.decomp_source == "kanjivg-atomic")
-    no_decomp = sum(1 for e in candidates if e.decomp_source == "none")
+    chise_decomp = stats["chise", "decomposed"]
+    chise_atomic = stats["chise", "atomic"]
+    kvg_decomp = stats["kvg", "decomposed"]
+    kvg_atomic = stats["kvg", "atomic"]
+    from_chise = stats["src", "chise"]
+    from_chise_atomic = stats["src", "chise-atomic"]
+    from_kanjivg = stats["src", "kanjivg"]
+    from_kanjivg_atomic = stats["src", "kanjivg-atomic"]
+    no_decomp = stats["src", "none"]
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Collect the report and write it with a single call
+    parts: list[str] = []
+    add = parts.append
+    entry_line = "{}  pop: {:>5}  src: {}\n".format
+    add("Grapheme Candidates Report\n")
+    add("=" * 40 + "\n")
+    add(f"Generated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}\n")
+    add(f"\nCriteria: is_grapheme=NO AND popularity>0 AND atomic in at least one library\n")
+    add(f"Total candidates: {total_candidates}\n")
+    add(f"\nLibrary Coverage (candidates only):\n")
+    add(f"  CHISE:   {chise_decomp + chise_atomic} total ({chise_decomp} decomposed, {chise_atomic} atomic)\n")
+    add(f"  KanjiVG: {kvg_decomp + kvg_atomic} total ({kvg_decomp} decomposed, {kvg_atomic} atomic)\n")
+    add(f"\nDecomposition Sources:\n")
+    add(f"  chise:         {from_chise:>5} ({100*from_chise/total_candidates:.1f}%)\n")
+    add(f"  chise-atomic:  {from_chise_atomic:>5} ({100*from_chise_atomic/total_candidates:.1f}%)\n")
+    add(f"  kanjivg:       {from_kanjivg:>5} ({100*from_kanjivg/total_candidates:.1f}%)\n")
+    add(f"  kanjivg-atomic:{from_kanjivg_atomic:>5} ({100*from_kanjivg_atomic/total_candidates:.1f}%)\n")
+    add(f"  none:          {no_decomp:>5} ({100*no_decomp/total_candidates:.1f}%)\n")
+    add("\n")
+
+    for stroke_count in by_strokes:
+        entries = by_strokes[stroke_count]
+        add(f"=== {stroke_count} Stroke{'s' if stroke_count != 1 else ''} ({len(entries)} candidates) ===\n")
+
+        for entry in entries:
+            add(entry_line(entry.normalized, entry.popularity, source_column(entry)))
+
+        add("\n")
+
     with open(output_path, "w", encoding="utf-8") as f:
-        f.write("Grapheme Candidates Report\n")
-        f.write("=" * 40 + "\n")
-        f.write(f"Generated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}\n")
-        f.write(f"\nCriteria: is_grapheme=NO AND popularity>0 AND atomic in at least one library\n")
-        f.write(f"Total candidates: {total_candidates}\n")
-        f.write(f"\nLibrary Coverage (candidates only):\n")
-        f.write(f"  CHISE:   {chise_decomp + chise_atomic} total ({chise_decomp} decomposed, {chise_atomic} atomic)\n")
-        f.write(f"  KanjiVG: {kvg_decomp + kvg_atomic} total ({kvg_decomp} decomposed, {kvg_atomic} atomic)\n")
-        f.write(f"\nDecomposition Sources:\n")
-        f.write(f"  chise:         {from_chise:>5} ({100*from_chise/total_candidates:.1f}%)\n")
-        f.write(f"  chise-atomic:  {from_chise_atomic:>5} ({100*from_chise_atomic/total_candidates:.1f}%)\n")
-        f.write(f"  kanjivg:       {from_kanjivg:>5} ({100*from_kanjivg/total_candidates:.1f}%)\n")
-        f.write(f"  kanjivg-atomic:{from_kanjivg_atomic:>5} ({100*from_kanjivg_atomic/total_candidates:.1f}%)\n")
-        f.write(f"  none:          {no_decomp:>5} ({100*no_decomp/total_candidates:.1f}%)\n")
-        f.write("\n")
-
-        for stroke_count in sorted(by_strokes.keys()):
-            entries = by_strokes[stroke_count]
-            f.write(f"=== {stroke_count} Stroke{'s' if stroke_count != 1 else ''} ({len(entries)} candidates) ===\n")
-
-            for entry in entries:
-                # Show "other" library status in parentheses
-                if entry.decomp_source.startswith("chise"):
-                    other_status = f"(kvg: {entry.kanjivg_status})"
-                elif entry.decomp_source.startswith("kanjivg"):
-                    other_status = f"(chise: {entry.chise_status})"
-                else:
-                    other_status = ""
-
-                f.write(f"{entry.normalized}  pop: {entry.popularity:>5}  src: {entry.decomp_source:<13} {other_status}\n")
-
-            f.write("\n")
+        f.write("".join(parts))
 
     print(f"  Written to: {output_path}")
 
@@ -475,73 +571,67 @@ def write_grapheme_popularity_report(
         print("  No graphemes found")
         return
 
-    # Group by stroke count
-    by_strokes: dict[int, list[KanjiEntry]] = defaultdict(list)
-    for entry in graphemes:
-        by_strokes[entry.stroke_count].append(entry)
-
-    # Sort each group by popularity descending
-    for stroke_count in by_strokes:
-        by_strokes[stroke_count].sort(key=lambda e: e.popularity, reverse=True)
+    # Group by stroke count, each group sorted by popularity descending
+    by_strokes = group_by_stroke(graphemes)
 
     # Calculate stats
+    stats = count_stats(graphemes)
     total_graphemes = len(graphemes)
-    from_chise = sum(1 for e in graphemes if e.decomp_source == "chise")
-    from_chise_atomic = sum(1 for e in graphemes if e.decomp_source == "chise-atomic")
-    from_kanjivg = sum(1 for e in graphemes if e.decomp_source == "kanjivg")
-    from_kanjivg_atomic = sum(1 for e in graphemes if e.decomp_source == "kanjivg-atomic")
-    no_decomp = sum(1 for e in graphemes if e.decomp_source == "none")
+    from_chise = stats["src", "chise"]
+    from_chise_atomic = stats["src", "chise-atomic"]
+    from_kanjivg = stats["src", "kanjivg"]
+    from_kanjivg_atomic = stats["src", "kanjivg-atomic"]
+    no_decomp = stats["src", "none"]
     total_popularity = sum(e.popularity for e in graphemes)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    # Collect the report and write it with a single call
+    parts: list[str] = []
+    add = parts.append
+    entry_line = "{}  pop: {:>5}  src: {}\n".format
+    add("Grapheme Popularity Report\n")
+    add("=" * 40 + "\n")
+    add(f"Generated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}\n")
+    add(f"\nTotal graphemes: {total_graphemes}\n")
+    add(f"Total popularity (sum): {total_popularity:,}\n")
+    add(f"\nDecomposition Sources:\n")
+    add(f"  chise:          {from_chise:>5} ({100*from_chise/total_graphemes:.1f}%)\n")
+    add(f"  chise-atomic:   {from_chise_atomic:>5} ({100*from_chise_atomic/total_graphemes:.1f}%)\n")
+    add(f"  kanjivg:        {from_kanjivg:>5} ({100*from_kanjivg/total_graphemes:.1f}%)\n")
+    add(f"  kanjivg-atomic: {from_kanjivg_atomic:>5} ({100*from_kanjivg_atomic/total_graphemes:.1f}%)\n")
+    add(f"  none:           {no_decomp:>5} ({100*no_decomp/total_graphemes:.1f}%)\n")
+    add("\n")
+
+    # Sort by stroke count DESCENDING (highest first)
+    for stroke_count in reversed(by_strokes):
+        entries = by_strokes[stroke_count]
+        add(f"=== {stroke_count} Stroke{'s' if stroke_count != 1 else ''} ({len(entries)} graphemes) ===\n")
+
+        for entry in entries:
+            add(entry_line(entry.normalized, entry.popularity, source_column(entry)))
+
+        add("\n")
+
     with open(output_path, "w", encoding="utf-8") as f:
-        f.write("Grapheme Popularity Report\n")
-        f.write("=" * 40 + "\n")
-        f.write(f"Generated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}\n")
-        f.write(f"\nTotal graphemes: {total_graphemes}\n")
-        f.write(f"Total popularity (sum): {total_popularity:,}\n")
-        f.write(f"\nDecomposition Sources:\n")
-        f.write(f"  chise:          {from_chise:>5} ({100*from_chise/total_graphemes:.1f}%)\n")
-        f.write(f"  chise-atomic:   {from_chise_atomic:>5} ({100*from_chise_atomic/total_graphemes:.1f}%)\n")
-        f.write(f"  kanjivg:        {from_kanjivg:>5} ({100*from_kanjivg/total_graphemes:.1f}%)\n")
-        f.write(f"  kanjivg-atomic: {from_kanjivg_atomic:>5} ({100*from_kanjivg_atomic/total_graphemes:.1f}%)\n")
-        f.write(f"  none:           {no_decomp:>5} ({100*no_decomp/total_graphemes:.1f}%)\n")
-        f.write("\n")
-
-        # Sort by stroke count DESCENDING (highest first)
-        for stroke_count in sorted(by_strokes.keys(), reverse=True):
-            entries = by_strokes[stroke_count]
-            f.write(f"=== {stroke_count} Stroke{'s' if stroke_count != 1 else ''} ({len(entries)} graphemes) ===\n")
-
-            for entry in entries:
-                # Show "other" library status in parentheses
-                if entry.decomp_source.startswith("chise"):
-                    other_status = f"(kvg: {entry.kanjivg_status})"
-                elif entry.decomp_source.startswith("kanjivg"):
-                    other_status = f"(chise: {entry.chise_status})"
-                else:
-                    other_status = ""
-
-                f.write(f"{entry.normalized}  pop: {entry.popularity:>5}  src: {entry.decomp_source:<13} {other_status}\n")
-
-            f.write("\n")
+        f.write("".join(parts))
 
     print(f"  Written to: {output_path}")
 
 
 def generate_json_output(
     kanji_dict: dict[str, KanjiEntry],
+    stats: Optional[Counter] = None,
 ) -> dict:
     """
     Generate JSON structure for HTML visualization.
-    """
-    # Group by stroke count
-    by_strokes: dict[str, list[dict]] = defaultdict(list)
-    entries_list: list[dict] = []
 
-    for entry in kanji_dict.values():
-        entry_dict = {
+    stats is count_stats(kanji_dict.values()), computed here if not given.
+    """
+    # One dict per entry; the stroke groups below hold references to these
+    # same dicts rather than copies
+    entries_list: list[dict] = [
+        {
             "char": entry.normalized,
             "original": entry.original,
             "stroke_count": entry.stroke_count,
@@ -552,22 +642,27 @@ def generate_json_output(
             "decomp_source": entry.decomp_source,
             "grapheme_id": entry.grapheme_id,
         }
-        entries_list.append(entry_dict)
-        by_strokes[str(entry.stroke_count)].append(entry_dict)
+        for entry in kanji_dict.values()
+    ]
 
-    # Sort each stroke group by popularity descending
-    for stroke_count in by_strokes:
-        by_strokes[stroke_count].sort(key=lambda e: e["popularity"], reverse=True)
+    # Group by stroke count, each group sorted by popularity descending
+    ordered = sorted(entries_list, key=lambda e: (e["stroke_count"], -e["popularity"]))
+    by_strokes = {
+        str(strokes): list(group)
+        for strokes, group in groupby(ordered, key=itemgetter("stroke_count"))
+    }
 
     # Calculate stats
+    if stats is None:
+        stats = count_stats(kanji_dict.values())
     total = len(kanji_dict)
-    chise_any = sum(1 for e in kanji_dict.values() if e.chise_status != "none")
-    kvg_any = sum(1 for e in kanji_dict.values() if e.kanjivg_status != "none")
-    from_chise = sum(1 for e in kanji_dict.values() if e.decomp_source == "chise")
-    from_chise_atomic = sum(1 for e in kanji_dict.values() if e.decomp_source == "chise-atomic")
-    from_kanjivg = sum(1 for e in kanji_dict.values() if e.decomp_source == "kanjivg")
-    from_kanjivg_atomic = sum(1 for e in kanji_dict.values() if e.decomp_source == "kanjivg-atomic")
-    graphemes = sum(1 for e in kanji_dict.values() if e.is_grapheme)
+    chise_any = total - stats["chise", "none"]
+    kvg_any = total - stats["kvg", "none"]
+    from_chise = stats["src", "chise"]
+    from_chise_atomic = stats["src", "chise-atomic"]
+    from_kanjivg = stats["src", "kanjivg"]
+    from_kanjivg_atomic = stats["src", "kanjivg-atomic"]
+    graphemes = stats["grapheme", True]
 
     return {
         "metadata": {
@@ -581,16 +676,24 @@ def generate_json_output(
             "from_kanjivg_atomic": from_kanjivg_atomic,
             "graphemes": graphemes,
         },
-        "by_stroke_count": dict(by_strokes),
+        "by_stroke_count": by_strokes,
         "entries": entries_list,
     }
 
 
 def write_json_output(data: dict, output_path: Path) -> None:
-    """Write JSON data to file."""
+    """
+    Write JSON data to file.
+
+    orjson serializes straight to UTF-8 bytes when installed; its 2-space
+    indented output matches json.dump(..., ensure_ascii=False, indent=2).
+    """
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
     print(f"  Written to: {output_path}")
 
 
@@ -610,13 +713,14 @@ def main():
 
     # Step 1: Load CHISE IDS data
     print("\n1. Loading CHISE IDS data...")
-    chise_ids = load_chise_ids()  # Uses default path from component_analysis
-    print(f"  Found {len(chise_ids)} characters with CHISE IDS data")
+    chise_components = load_chise_components()  # Uses default path from component_analysis
+    print(f"  Found {len(chise_components)} characters with CHISE IDS data")
 
     # Step 2: Load KanjiVG index
     print("\n2. Loading KanjiVG index...")
     kanjivg_chars = load_kanjivg_index()  # Uses default path from component_analysis
     print(f"  Found {len(kanjivg_chars)} characters with KanjiVG data")
+    kanjivg_components = load_kanjivg_components(kanjivg_chars)
 
     # Step 3: Load graphemes from Turso
     print("\n3. Loading graphemes from Turso...")
@@ -647,18 +751,20 @@ def main():
         kanjidic_entries,
         grapheme_primaries,
         variant_to_canonical,
-        chise_ids,
-        kanjivg_chars,
+        chise_components,
+        kanjivg_components,
         normalizer,
     )
     print(f"  Created {len(kanji_dict)} unique normalized entries")
 
-    # Show source breakdown
-    from_chise = sum(1 for e in kanji_dict.values() if e.decomp_source == "chise")
-    from_chise_atomic = sum(1 for e in kanji_dict.values() if e.decomp_source == "chise-atomic")
-    from_kanjivg = sum(1 for e in kanji_dict.values() if e.decomp_source == "kanjivg")
-    from_kanjivg_atomic = sum(1 for e in kanji_dict.values() if e.decomp_source == "kanjivg-atomic")
-    no_decomp = sum(1 for e in kanji_dict.values() if e.decomp_source == "none")
+    # Show source breakdown. These counts come from the first pass only, so
+    # they are shared with the text report and JSON output below.
+    stats = count_stats(kanji_dict.values())
+    from_chise = stats["src", "chise"]
+    from_chise_atomic = stats["src", "chise-atomic"]
+    from_kanjivg = stats["src", "kanjivg"]
+    from_kanjivg_atomic = stats["src", "kanjivg-atomic"]
+    no_decomp = stats["src", "none"]
     print(f"  From CHISE: {from_chise} decomposed, {from_chise_atomic} atomic")
     print(f"  From KanjiVG: {from_kanjivg} decomposed, {from_kanjivg_atomic} atomic")
     print(f"  None (not in either): {no_decomp}")
@@ -670,8 +776,8 @@ def main():
         grapheme_primaries,
         variant_to_canonical,
         grapheme_id_to_doc,
-        chise_ids,
-        kanjivg_chars,
+        chise_components,
+        kanjivg_components,
         normalizer,
     )
 
@@ -680,20 +786,20 @@ def main():
     if args.dry_run:
         print("  Dry run - skipping file writes")
     else:
-        write_text_report(kanji_dict, OUTPUT_TXT)
-        json_data = generate_json_output(kanji_dict)
+        write_text_report(kanji_dict, OUTPUT_TXT, stats)
+        json_data = generate_json_output(kanji_dict, stats)
         write_json_output(json_data, OUTPUT_JSON)
         write_candidates_report(kanji_dict, OUTPUT_CANDIDATES)
         write_grapheme_popularity_report(kanji_dict, OUTPUT_GRAPHEME_POP)
 
     # Summary stats
     total = len(kanji_dict)
-    graphemes = sum(1 for e in kanji_dict.values() if e.is_grapheme)
-    top_popular = sorted(
-        [e for e in kanji_dict.values() if e.popularity > 0],
-        key=lambda e: e.popularity,
-        reverse=True
-    )[:10]
+    graphemes = stats["grapheme", True]
+    top_popular = heapq.nlargest(
+        10,
+        (e for e in kanji_dict.values() if e.popularity > 0),
+        key=attrgetter("popularity"),
+    )
 
     print("\n" + "=" * 40)
     print("Summary:")
@@ -702,14 +808,7 @@ def main():
     print(f"  Identified as graphemes: {graphemes}")
     print(f"\nTop 10 most popular components:")
     for entry in top_popular:
-        # Show "other" library status
-        if entry.decomp_source.startswith("chise"):
-            other = f"(kvg: {entry.kanjivg_status})"
-        elif entry.decomp_source.startswith("kanjivg"):
-            other = f"(chise: {entry.chise_status})"
-        else:
-            other = ""
-        print(f"  {entry.normalized}  pop: {entry.popularity:>4}  grapheme: {'Y' if entry.is_grapheme else 'N'}  src: {entry.decomp_source:<13} {other}")
+        print(f"  {entry.normalized}  pop: {entry.popularity:>4}  grapheme: {'Y' if entry.is_grapheme else 'N'}  src: {source_column(entry)}")
 
     print("\nDone.")
 
@@ -26,14 +26,15 @@ from lib.paths import DEPENDENCY_DOCS
 from lib.grapheme_io import (
     load_graphemes_with_mappings,
     build_variant_to_symbol_mapping,
-    write_json_document,
-    delete_json_document,
+    write_json_documents,
+    delete_json_documents,
 )
 from lib.normalizers import make_grapheme_normalizer
 from adapters.component_analysis import (
-    load_chise_ids,
+    load_chise_components,
     load_kanjivg_index,
-    get_all_components_expanded,
+    load_kanjivg_components,
+    make_components_expander,
 )
 
 
@@ -103,18 +104,27 @@ def main():
 
     # Step 2: Load decomposition data
     print("\n2. Loading decomposition data...")
-    chise_ids = load_chise_ids()
-    print(f"   CHISE IDS: {len(chise_ids)} characters")
+    chise_components = load_chise_components()
+    print(f"   CHISE IDS: {len(chise_components)} characters")
     kanjivg_chars = load_kanjivg_index()
     print(f"   KanjiVG: {len(kanjivg_chars)} characters")
+    kanjivg_components = load_kanjivg_components(kanjivg_chars)
 
     # Step 3: Create normalizer
     variant_to_symbol = build_variant_to_symbol_mapping(graphemes, symbol_to_id, variant_to_id)
     normalizer = make_grapheme_normalizer(variant_to_symbol)
 
+    # Memoized component expansion: variants of common components are
+    # expanded for every grapheme that contains them
+    expand_components = make_components_expander(chise_components, kanjivg_components, normalizer)
+
     # Build id_to_doc mapping for quick lookup
     id_to_doc: dict[str, dict] = graphemes
 
+    # Symbol (primary or variant) -> grapheme id in one dict; primary symbols
+    # take precedence over variant symbols
+    component_to_gid = {**variant_to_id, **symbol_to_id}
+
     # Step 4: Process each grapheme with expanded search
     print("\n3. Processing graphemes (expanded search)...")
     new_dependencies: dict[str, dict] = {}  # grapheme_id -> dependency document
@@ -126,13 +136,13 @@ def main():
             continue
 
         # Get ALL components using expanded search (union of CHISE + KanjiVG, original + normalized)
-        giant_set = get_all_components_expanded(symbol, chise_ids, kanjivg_chars, normalizer)
+        giant_set = set(expand_components(symbol))
 
         # Also search children of this grapheme's variants
         for variant in doc.get("variants", []):
             variant_symbol = variant.get("symbol")
             if variant_symbol:
-                variant_children = get_all_components_expanded(variant_symbol, chise_ids, kanjivg_chars, normalizer)
+                variant_children = expand_components(variant_symbol)
                 giant_set.update(variant_children)
 
         if not giant_set:
@@ -144,42 +154,30 @@ def main():
         for comp in giant_set:
             normalized_comp = normalizer(comp)
             # Check if component is a grapheme
-            comp_gid = symbol_to_id.get(normalized_comp) or variant_to_id.get(normalized_comp)
+            comp_gid = component_to_gid.get(normalized_comp)
             if comp_gid and comp_gid in id_to_doc:
                 comp_doc = id_to_doc[comp_gid]
                 # Get children of the component's variants
                 for variant in comp_doc.get("variants", []):
                     variant_symbol = variant.get("symbol")
                     if variant_symbol:
-                        variant_children = get_all_components_expanded(variant_symbol, chise_ids, kanjivg_chars, normalizer)
+                        variant_children = expand_components(variant_symbol)
                         expanded_giant_set.update(variant_children)
 
         giant_set = expanded_giant_set
 
-        # Normalize all children and build dict: normalized -> [originals]
-        # Then filter to only those that are graphemes
-        normalized_to_originals: dict[str, list[str]] = {}
+        # Filter to only components whose normalized form is a grapheme
+        # (dict keys deduplicate while keeping first-seen order)
+        grapheme_component_ids: dict[str, None] = {}
         for comp in giant_set:
-            normalized_comp = normalizer(comp)
-            if normalized_comp not in normalized_to_originals:
-                normalized_to_originals[normalized_comp] = []
-            if comp not in normalized_to_originals[normalized_comp]:
-                normalized_to_originals[normalized_comp].append(comp)
-
-        # Filter to only normalized components that are graphemes
-        grapheme_component_ids: list[str] = []
-        for normalized_comp in normalized_to_originals.keys():
             # Check if it's a grapheme (primary or variant)
-            comp_gid = symbol_to_id.get(normalized_comp)
-            if not comp_gid:
-                comp_gid = variant_to_id.get(normalized_comp)
+            comp_gid = component_to_gid.get(normalizer(comp))
 
             if comp_gid and comp_gid != gid:  # Don't include self
-                if comp_gid not in grapheme_component_ids:  # Deduplicate
-                    grapheme_component_ids.append(comp_gid)
+                grapheme_component_ids[comp_gid] = None
 
         if grapheme_component_ids:
-            dep_doc = create_dependency_document(gid, grapheme_component_ids)
+            dep_doc = create_dependency_document(gid, list(grapheme_component_ids))
             new_dependencies[gid] = dep_doc
             stats["with_deps"] += 1
         else:
@@ -214,25 +212,13 @@ def main():
         print("\n5. Writing files...")
 
         # Create/update
-        created = 0
-        updated = 0
-        for gid, dep_doc in new_dependencies.items():
-            filename = get_dependency_filename(gid)
-            filepath = DEPENDENCY_DOCS / filename
-
-            was_new = not filepath.exists()
-            if write_json_document(dep_doc, filepath):
-                if was_new:
-                    created += 1
-                else:
-                    updated += 1
+        filenames = [get_dependency_filename(gid) for gid in new_dependencies]
+        changed = write_json_documents(new_dependencies.values(), [DEPENDENCY_DOCS / filename for filename in filenames])
+        created = sum(1 for filename, was_changed in zip(filenames, changed) if was_changed and filename in to_create)
+        updated = sum(changed) - created
 
         # Delete stale
-        deleted = 0
-        for filename in to_delete:
-            filepath = DEPENDENCY_DOCS / filename
-            if delete_json_document(filepath):
-                deleted += 1
+        deleted = sum(delete_json_documents(DEPENDENCY_DOCS / filename for filename in to_delete))
 
         print(f"   Created: {created}")
         print(f"   Updated: {updated}")
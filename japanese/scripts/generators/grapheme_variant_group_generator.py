@@ -26,7 +26,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from lib.paths import VARIANT_GROUP_DOCS
-from lib.grapheme_io import load_graphemes, write_json_document, delete_json_document
+from lib.grapheme_io import load_graphemes, write_json_documents, delete_json_documents
 
 
 # ---------------------------------------------------------------------------
@@ -42,6 +42,16 @@ def find_variant_groups(graphemes: dict[str, dict]) -> dict[str, set[str]]:
     """
     groups: dict[str, set[str]] = {}
 
+    # Index graphemes by name, and by name or alias, in document order so
+    # the first match (which names the group) is the same as a full scan
+    name_to_gids: dict[str, list[str]] = {}
+    name_or_alias_to_gids: dict[str, list[str]] = {}
+    for gid, doc in graphemes.items():
+        name = doc.get("name")
+        name_to_gids.setdefault(name, []).append(gid)
+        for key in {name, *doc.get("nameAliases", [])}:
+            name_or_alias_to_gids.setdefault(key, []).append(gid)
+
     for gid, doc in graphemes.items():
         name = doc.get("name", "")
 
@@ -53,11 +63,8 @@ def find_variant_groups(graphemes: dict[str, dict]) -> dict[str, set[str]]:
 
         # Try exact base name match first
         matches = [
-            (g, d) for g, d in graphemes.items()
-            if g != gid and (
-                d.get("name") == base_name or
-                base_name in d.get("nameAliases", [])
-            )
+            (g, graphemes[g]) for g in name_or_alias_to_gids.get(base_name, [])
+            if g != gid
         ]
 
         if matches:
@@ -72,8 +79,8 @@ def find_variant_groups(graphemes: dict[str, dict]) -> dict[str, set[str]]:
             # Try partial match - first word of base_name
             first_word = base_name.split()[0] if base_name else ""
             partial_matches = [
-                (g, d) for g, d in graphemes.items()
-                if g != gid and d.get("name") == first_word
+                (g, graphemes[g]) for g in name_to_gids.get(first_word, [])
+                if g != gid
             ]
 
             if partial_matches:
@@ -194,24 +201,12 @@ def main():
         print("\n5. Writing files...")
 
         # Create/update
-        created = 0
-        updated = 0
-        for filename, doc in new_documents.items():
-            filepath = VARIANT_GROUP_DOCS / filename
-
-            was_new = not filepath.exists()
-            if write_json_document(doc, filepath):
-                if was_new:
-                    created += 1
-                else:
-                    updated += 1
+        changed = write_json_documents(new_documents.values(), [VARIANT_GROUP_DOCS / filename for filename in new_documents])
+        created = sum(1 for filename, was_changed in zip(new_documents, changed) if was_changed and filename in to_create)
+        updated = sum(changed) - created
 
         # Delete stale
-        deleted = 0
-        for filename in to_delete:
-            filepath = VARIANT_GROUP_DOCS / filename
-            if delete_json_document(filepath):
-                deleted += 1
+        deleted = sum(delete_json_documents(VARIANT_GROUP_DOCS / filename for filename in to_delete))
 
         print(f"   Created: {created}")
         print(f"   Updated: {updated}")
@@ -23,13 +23,14 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from adapters.kanjidic import parse_kanjidic_full
 from adapters.component_analysis import (
-    load_chise_ids,
+    load_chise_components,
     load_kanjivg_index,
+    load_kanjivg_components,
     get_all_components_expanded,
 )
 from lib.normalizers import nfkc_plus
 from lib.paths import KANJI_DEP_DOCS
-from lib.grapheme_io import write_json_document, delete_json_document
+from lib.grapheme_io import write_json_documents, delete_json_documents
 
 
 def codepoint_str(char: str) -> str:
@@ -124,10 +125,11 @@ def main():
 
     # Step 2: Load decomposition data
     print("\n2. Loading decomposition data...")
-    chise_ids = load_chise_ids()
-    print(f"   CHISE IDS: {len(chise_ids)} characters")
+    chise_components = load_chise_components()
+    print(f"   CHISE IDS: {len(chise_components)} characters")
     kanjivg_chars = load_kanjivg_index()
     print(f"   KanjiVG: {len(kanjivg_chars)} characters")
+    kanjivg_components = load_kanjivg_components(kanjivg_chars)
 
     # Step 3: Process each kanji
     print("\n3. Processing kanji...")
@@ -138,20 +140,20 @@ def main():
         # CHISE/KanjiVG). get_all_components_expanded also tries the
         # nfkc_plus-normalized form internally.
         components = get_all_components_expanded(
-            entry.literal, chise_ids, kanjivg_chars, nfkc_plus
+            entry.literal, chise_components, kanjivg_components, nfkc_plus
         )
 
         # Filter to components that are kanji in our set
-        prerequisite_ids: list[str] = []
+        # (dict keys deduplicate while keeping first-seen order)
+        prerequisite_ids: dict[str, None] = {}
         for comp in components:
             normalized_comp = nfkc_plus(comp)
             comp_kanji_id = kanji_symbol_to_id.get(normalized_comp)
             if comp_kanji_id and comp_kanji_id != kanji_id:  # Not self
-                if comp_kanji_id not in prerequisite_ids:  # Deduplicate
-                    prerequisite_ids.append(comp_kanji_id)
+                prerequisite_ids[comp_kanji_id] = None
 
         if prerequisite_ids:
-            dep_doc = create_dependency_document(kanji_id, prerequisite_ids)
+            dep_doc = create_dependency_document(kanji_id, list(prerequisite_ids))
             new_dependencies[kanji_id] = dep_doc
 
     with_deps = len(new_dependencies)
@@ -186,23 +188,12 @@ def main():
     else:
         print("\n5. Writing files...")
 
-        created = 0
-        updated = 0
-        for kanji_id, dep_doc in new_dependencies.items():
-            filename = get_dep_filename(kanji_id)
-            filepath = KANJI_DEP_DOCS / filename
-            was_new = not filepath.exists()
-            if write_json_document(dep_doc, filepath):
-                if was_new:
-                    created += 1
-                else:
-                    updated += 1
-
-        deleted = 0
-        for filename in to_delete:
-            filepath = KANJI_DEP_DOCS / filename
-            if delete_json_document(filepath):
-                deleted += 1
+        filenames = [get_dep_filename(kanji_id) for kanji_id in new_dependencies]
+        changed = write_json_documents(new_dependencies.values(), [KANJI_DEP_DOCS / filename for filename in filenames])
+        created = sum(1 for filename, was_changed in zip(filenames, changed) if was_changed and filename in to_create)
+        updated = sum(changed) - created
+
+        deleted = sum(delete_json_documents(KANJI_DEP_DOCS / filename for filename in to_delete))
 
         print(f"   Created: {created}")
         print(f"   Updated: {updated}")
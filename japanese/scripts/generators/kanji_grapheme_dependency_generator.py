@@ -23,16 +23,17 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from adapters.kanjidic import parse_kanjidic_full
 from adapters.component_analysis import (
-    load_chise_ids,
+    load_chise_components,
     load_kanjivg_index,
+    load_kanjivg_components,
     get_all_components_expanded,
 )
 from lib.normalizers import nfkc_plus
 from lib.paths import KANJI_GRAPHEME_DEP_DOCS
 from lib.grapheme_io import (
     load_graphemes_with_mappings,
-    write_json_document,
-    delete_json_document,
+    write_json_documents,
+    delete_json_documents,
 )
 
 
@@ -131,12 +132,17 @@ def main():
     print(f"   Primary symbols: {len(symbol_to_id)}")
     print(f"   Variant symbols: {len(variant_to_id)}")
 
+    # Symbol (primary or variant) -> grapheme id in one dict; primary symbols
+    # take precedence over variant symbols (which map to their canonical id)
+    component_to_gid = {**variant_to_id, **symbol_to_id}
+
     # Step 3: Load decomposition data
     print("\n3. Loading decomposition data...")
-    chise_ids = load_chise_ids()
-    print(f"   CHISE IDS: {len(chise_ids)} characters")
+    chise_components = load_chise_components()
+    print(f"   CHISE IDS: {len(chise_components)} characters")
     kanjivg_chars = load_kanjivg_index()
     print(f"   KanjiVG: {len(kanjivg_chars)} characters")
+    kanjivg_components = load_kanjivg_components(kanjivg_chars)
 
     # Step 4: Process each kanji
     print("\n4. Processing kanji...")
@@ -147,25 +153,23 @@ def main():
         # CHISE/KanjiVG). get_all_components_expanded also tries the
         # nfkc_plus-normalized form internally.
         components = get_all_components_expanded(
-            entry.literal, chise_ids, kanjivg_chars, nfkc_plus
+            entry.literal, chise_components, kanjivg_components, nfkc_plus
         )
 
         # Filter to components that are graphemes in our set
-        grapheme_ids: list[str] = []
+        # (dict keys deduplicate while keeping first-seen order)
+        grapheme_ids: dict[str, None] = {}
         for comp in components:
             normalized_comp = nfkc_plus(comp)
 
-            # Check primary grapheme symbols
-            gid = symbol_to_id.get(normalized_comp)
-            # Fall back to variant symbols (maps to canonical grapheme ID)
-            if not gid:
-                gid = variant_to_id.get(normalized_comp)
+            # Primary grapheme symbol, else variant symbol (canonical grapheme ID)
+            gid = component_to_gid.get(normalized_comp)
 
-            if gid and gid not in grapheme_ids:
-                grapheme_ids.append(gid)
+            if gid:
+                grapheme_ids[gid] = None
 
         if grapheme_ids:
-            dep_doc = create_grapheme_dep_document(kanji_id, grapheme_ids)
+            dep_doc = create_grapheme_dep_document(kanji_id, list(grapheme_ids))
             new_dependencies[kanji_id] = dep_doc
 
     with_deps = len(new_dependencies)
@@ -200,23 +204,12 @@ def main():
     else:
         print("\n6. Writing files...")
 
-        created = 0
-        updated = 0
-        for kanji_id, dep_doc in new_dependencies.items():
-            filename = get_dep_filename(kanji_id)
-            filepath = KANJI_GRAPHEME_DEP_DOCS / filename
-            was_new = not filepath.exists()
-            if write_json_document(dep_doc, filepath):
-                if was_new:
-                    created += 1
-                else:
-                    updated += 1
-
-        deleted = 0
-        for filename in to_delete:
-            filepath = KANJI_GRAPHEME_DEP_DOCS / filename
-            if delete_json_document(filepath):
-                deleted += 1
+        filenames = [get_dep_filename(kanji_id) for kanji_id in new_dependencies]
+        changed = write_json_documents(new_dependencies.values(), [KANJI_GRAPHEME_DEP_DOCS / filename for filename in filenames])
+        created = sum(1 for filename, was_changed in zip(filenames, changed) if was_changed and filename in to_create)
+        updated = sum(changed) - created
+
+        deleted = sum(delete_json_documents(KANJI_GRAPHEME_DEP_DOCS / filename for filename in to_delete))
 
         print(f"   Created: {created}")
         print(f"   Updated: {updated}")
@@ -7,12 +7,65 @@ Consolidates grapheme loading logic used across multiple scripts.
 """
 
 import json
+import pickle
+import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 from .paths import GRAPHEME_DOCS, DEPENDENCY_DOCS, VARIANT_GROUP_DOCS
 
+# Optional fast JSON parser/serializer (falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Bump when a cached loader's output shape changes to invalidate caches
+_CACHE_VERSION = 1
+
+
+# ---------------------------------------------------------------------------
+# JSON Document Reading
+# ---------------------------------------------------------------------------
+
+def read_json_document(filepath: Path):
+    """
+    Read and parse one JSON document.
+
+    The file is pulled in with a single read as raw bytes and parsed from
+    memory, skipping the text-mode decoding layer and its small buffered
+    reads. orjson parses the bytes when installed; its errors subclass
+    json.JSONDecodeError, so callers can catch either the same way.
+
+    Args:
+        filepath: Path to the JSON file
+
+    Returns:
+        The parsed document
+    """
+    data = filepath.read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def read_json_documents(paths: Iterable[Path], max_workers: Optional[int] = None) -> list:
+    """
+    Read and parse many JSON documents on a thread pool.
+
+    Per-file open/read latency overlaps instead of being paid serially,
+    which matters most on a cold cache or a network filesystem.
+
+    Args:
+        paths: Paths to the JSON files
+        max_workers: Thread pool size (default: ThreadPoolExecutor default)
+
+    Returns:
+        The parsed documents, in the same order as paths
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(read_json_document, paths))
+
 
 # ---------------------------------------------------------------------------
 # Grapheme Loading
@@ -22,18 +75,27 @@ def load_graphemes(docs_dir: Path = GRAPHEME_DOCS) -> dict[str, dict]:
     """
     Load all grapheme documents.
 
+    Parsed documents are cached next to the directory (see
+    _load_cached_documents) and reused while the directory is unchanged.
+
     Args:
         docs_dir: Directory containing grapheme JSON files
 
     Returns:
-        Dict mapping $id -> document
+        Dict mapping $id -> document (ids are interned)
     """
+    graphemes = _load_cached_documents(docs_dir, "graphemes", _parse_graphemes)
+    intern = sys.intern
+    return {intern(gid): doc for gid, doc in graphemes.items()}
+
+
+def _parse_graphemes(docs_dir: Path) -> dict[str, dict]:
+    """Parse every grapheme document in docs_dir, keyed by $id."""
     graphemes: dict[str, dict] = {}
+    intern = sys.intern
 
-    for json_file in docs_dir.glob("*.json"):
-        with open(json_file, "r", encoding="utf-8") as f:
-            doc = json.load(f)
-            graphemes[doc["$id"]] = doc
+    for doc in read_json_documents(docs_dir.glob("*.json")):
+        graphemes[intern(doc["$id"])] = doc
 
     return graphemes
 
@@ -56,23 +118,22 @@ def load_graphemes_with_mappings(
     graphemes: dict[str, dict] = {}
     symbol_to_id: dict[str, str] = {}
     variant_to_id: dict[str, str] = {}
+    intern = sys.intern
 
-    for json_file in docs_dir.glob("*.json"):
-        with open(json_file, "r", encoding="utf-8") as f:
-            doc = json.load(f)
-            gid = doc["$id"]
-            graphemes[gid] = doc
+    for doc in read_json_documents(docs_dir.glob("*.json")):
+        gid = intern(doc["$id"])
+        graphemes[gid] = doc
 
-            # Map primary symbol
-            symbol = doc.get("symbol")
-            if symbol:
-                symbol_to_id[symbol] = gid
+        # Map primary symbol
+        symbol = doc.get("symbol")
+        if symbol:
+            symbol_to_id[symbol] = gid
 
-            # Map variants
-            for variant in doc.get("variants", []):
-                variant_symbol = variant.get("symbol")
-                if variant_symbol:
-                    variant_to_id[variant_symbol] = gid
+        # Map variants
+        for variant in doc.get("variants", []):
+            variant_symbol = variant.get("symbol")
+            if variant_symbol:
+                variant_to_id[variant_symbol] = gid
 
     return graphemes, symbol_to_id, variant_to_id
 
@@ -91,12 +152,7 @@ def load_graphemes_sorted(
     Returns:
         List of grapheme documents, sorted
     """
-    docs = []
-
-    for filepath in docs_dir.glob("*.json"):
-        with open(filepath, "r", encoding="utf-8") as f:
-            doc = json.load(f)
-            docs.append(doc)
+    docs = read_json_documents(docs_dir.glob("*.json"))
 
     if sort_key is None:
         sort_key = lambda d: (d.get("strokeCount") or 999, d.get("unicode", ""))
@@ -115,6 +171,9 @@ def load_dependencies(
     """
     Load grapheme dependency documents.
 
+    The parsed maps are cached next to the directory (see
+    _load_cached_documents) and reused while the directory is unchanged.
+
     Args:
         docs_dir: Directory containing dependency JSON files
 
@@ -122,32 +181,98 @@ def load_dependencies(
         Tuple of:
         - deps: dict mapping parent_id -> [component_ids]
         - reverse_deps: dict mapping component_id -> [parent_ids]
+
+        Ids are interned, so each grapheme id is a single string object
+        shared by both dicts and by load_graphemes' keys.
     """
+    deps, reverse_deps = _load_cached_documents(docs_dir, "dependencies", _parse_dependencies)
+    intern = sys.intern
+    deps = {intern(pid): [intern(cid) for cid in cids] for pid, cids in deps.items()}
+    reverse_deps = {intern(cid): [intern(pid) for pid in pids] for cid, pids in reverse_deps.items()}
+    return deps, reverse_deps
+
+
+def _parse_dependencies(
+    docs_dir: Path
+) -> tuple[dict[str, list[str]], dict[str, list[str]]]:
+    """Parse every dependency document in docs_dir into (deps, reverse_deps)."""
     deps: dict[str, list[str]] = {}
     reverse_deps: dict[str, list[str]] = defaultdict(list)
+    intern = sys.intern
 
-    for json_file in docs_dir.glob("*.json"):
-        with open(json_file, "r", encoding="utf-8") as f:
-            doc = json.load(f)
-            parent_id = doc["connectors"]["parent"]["$id"]
+    for doc in read_json_documents(docs_dir.glob("*.json")):
+        parent_id = intern(doc["connectors"]["parent"]["$id"])
 
-            # Extract unique components while preserving order
-            components = []
-            seen = set()
-            for item in doc.get("many", []):
-                cid = item["connectors"]["component"]["$id"]
-                if cid not in seen:
-                    seen.add(cid)
-                    components.append(cid)
+        # Extract unique components while preserving order
+        components = []
+        seen = set()
+        for item in doc.get("many", []):
+            cid = intern(item["connectors"]["component"]["$id"])
+            if cid not in seen:
+                seen.add(cid)
+                components.append(cid)
 
-            deps[parent_id] = components
+        deps[parent_id] = components
 
-            for cid in components:
-                reverse_deps[cid].append(parent_id)
+        for cid in components:
+            reverse_deps[cid].append(parent_id)
 
     return deps, dict(reverse_deps)
 
 
+# ---------------------------------------------------------------------------
+# Parsed Document Cache
+# ---------------------------------------------------------------------------
+
+def _docs_cache_key(docs_dir: Path) -> tuple[int, int, int, int]:
+    """
+    Fingerprint a documents directory for cache validation.
+
+    The directory mtime catches added, removed and renamed files; the newest
+    file mtime catches documents rewritten in place, which leave the
+    directory mtime untouched.
+    """
+    mtimes = [p.stat().st_mtime_ns for p in docs_dir.glob("*.json")]
+    return (_CACHE_VERSION, docs_dir.stat().st_mtime_ns, len(mtimes), max(mtimes, default=0))
+
+
+def _load_cached_documents(docs_dir: Path, name: str, parse):
+    """
+    Return parse(docs_dir), cached as <docs_dir>.<name>.cache.pkl.
+
+    The cache is one pickle beside the directory and is reused while its
+    stored key matches _docs_cache_key, replacing one JSON parse per
+    document with a single read.
+
+    Args:
+        docs_dir: Directory of JSON documents
+        name: Cache name, distinguishing loaders that share a directory
+        parse: Function parsing docs_dir on a cache miss
+
+    Returns:
+        The parsed value
+    """
+    cache_path = docs_dir.with_name(f"{docs_dir.name}.{name}.cache.pkl")
+    key = _docs_cache_key(docs_dir)
+
+    if cache_path.exists():
+        try:
+            cached_key, value = pickle.loads(cache_path.read_bytes())
+            if cached_key == key:
+                return value
+        except Exception:
+            pass  # Unreadable or incompatible cache, re-parse
+
+    value = parse(docs_dir)
+
+    try:
+        cache_path.write_bytes(pickle.dumps((key, value), protocol=5))
+    except OSError:
+        pass  # Caching is best-effort
+
+    return value
+
+
 # ---------------------------------------------------------------------------
 # Variant Group Loading
 # ---------------------------------------------------------------------------
@@ -166,10 +291,8 @@ def load_variant_groups(
     """
     groups: dict[str, dict] = {}
 
-    for json_file in docs_dir.glob("*.json"):
-        with open(json_file, "r", encoding="utf-8") as f:
-            doc = json.load(f)
-            groups[doc["$id"]] = doc
+    for doc in read_json_documents(docs_dir.glob("*.json")):
+        groups[doc["$id"]] = doc
 
     return groups
 
@@ -191,27 +314,56 @@ def write_json_document(doc: dict, filepath: Path) -> bool:
     Returns:
         True if file was created or content changed, False if unchanged
     """
-    # Check if content changed
-    if filepath.exists():
-        with open(filepath, "r", encoding="utf-8") as f:
-            try:
-                existing = json.load(f)
-                if existing == doc:
-                    return False  # No change
-            except json.JSONDecodeError:
-                pass  # File is corrupted, overwrite it
+    # Serialize once and write in a single call (json.dump writes per token).
+    # orjson's 2-space indented output matches json.dumps(..., indent=2)
+    if orjson is not None:
+        payload = orjson.dumps(doc, option=orjson.OPT_INDENT_2) + b"\n"
+    else:
+        payload = (json.dumps(doc, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+
+    # Check if content changed. Generated files normally match byte for
+    # byte; the parse only runs for files formatted some other way
+    try:
+        existing = filepath.read_bytes()
+    except FileNotFoundError:
+        pass
+    else:
+        if existing == payload:
+            return False  # No change
+        try:
+            if (orjson.loads(existing) if orjson is not None else json.loads(existing)) == doc:
+                return False  # No change
+        except json.JSONDecodeError:
+            pass  # File is corrupted, overwrite it
 
     # Ensure parent directory exists
     filepath.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write the document
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(doc, f, ensure_ascii=False, indent=2)
-        f.write("\n")
+    filepath.write_bytes(payload)
 
     return True
 
 
+def write_json_documents(
+    docs: Iterable[dict],
+    paths: Iterable[Path],
+    max_workers: Optional[int] = None,
+) -> list[bool]:
+    """
+    Write many JSON documents (see write_json_document) on a thread pool.
+
+    Args:
+        docs: The documents to write
+        paths: Path to write each document to
+        max_workers: Thread pool size (default: ThreadPoolExecutor default)
+
+    Returns:
+        For each document, in order, True if it was created or changed
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(write_json_document, docs, paths))
+
+
 def delete_json_document(filepath: Path) -> bool:
     """
     Delete a JSON document if it exists.
@@ -228,6 +380,21 @@ def delete_json_document(filepath: Path) -> bool:
     return False
 
 
+def delete_json_documents(paths: Iterable[Path], max_workers: Optional[int] = None) -> list[bool]:
+    """
+    Delete many JSON documents (see delete_json_document) on a thread pool.
+
+    Args:
+        paths: Paths to delete
+        max_workers: Thread pool size (default: ThreadPoolExecutor default)
+
+    Returns:
+        For each path, in order, True if the file was deleted
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(delete_json_document, paths))
+
+
 # ---------------------------------------------------------------------------
 # Utility Functions
 # ---------------------------------------------------------------------------
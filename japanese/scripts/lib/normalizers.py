@@ -5,6 +5,7 @@ Normalization strategies for kanji component comparison.
 Each normalizer is a function that takes a character and returns its normalized form.
 """
 
+import functools
 import unicodedata
 from typing import Callable
 
@@ -59,7 +60,8 @@ def nfkc(char: str) -> str:
     Does NOT handle:
     - CJK Radicals Supplement (U+2E80-2EFF) - these stay as-is
     """
-    if len(char) != 1:
+    # ASCII is already NFKC-stable
+    if len(char) != 1 or char.isascii():
         return char
 
     seen = {char}
@@ -73,12 +75,16 @@ def nfkc(char: str) -> str:
         result = normalized
 
 
+@functools.lru_cache(maxsize=None)
 def nfkc_plus(char: str) -> str:
     """
     NFKC plus manual mappings for CJK Radicals Supplement (U+2E80-2EFF).
 
     These are positional variants that NFKC doesn't handle.
     Maps them to their base CJK forms where the visual form is identical.
+
+    Memoized: generators normalize every component of every kanji, but
+    only a few thousand distinct characters occur.
     """
     # First apply NFKC
     result = nfkc(char)
@@ -118,12 +124,17 @@ def make_grapheme_normalizer(variant_to_symbol: dict[str, str]) -> Normalizer:
     This ensures that variant symbols (like 匚) get normalized to their
     canonical form (匸) before processing.
 
+    The returned normalizer is memoized: it is called for every component
+    visit, but only sees a few thousand distinct characters. The mapping
+    must not be changed after the normalizer is created.
+
     Args:
         variant_to_symbol: Dict mapping variant symbol -> canonical symbol
 
     Returns:
         A normalizer function that applies both nfkc_plus and variant mapping
     """
+    @functools.lru_cache(maxsize=None)
     def normalize(char: str) -> str:
         # First apply Unicode normalization
         result = nfkc_plus(char)
@@ -101,3 +101,6 @@ POPULARITY_JSON = REPORTS_DIR / "component-popularity.json"
 # ---------------------------------------------------------------------------
 
 TURSO_ENV_FILE = PROJECT_ROOT / "UL-App" / "infra" / "turso" / ".env"
+
+# Local embedded replica of the Turso database (synced on connect)
+TURSO_REPLICA_PATH = SOURCE_DIR / "turso.replica.db"